@@ -1,8 +1,22 @@
 """Setlist Maker - Generate tracklists from DJ sets using Shazam."""
 
 from importlib.metadata import version
+from pathlib import Path
 
 __version__ = version("setlist-maker")
 
 # Supported audio extensions (shared across modules)
-AUDIO_EXTENSIONS = {".mp3", ".wav", ".flac", ".m4a", ".ogg", ".aac", ".wma", ".aiff"}
+AUDIO_EXTENSIONS = frozenset({".mp3", ".wav", ".flac", ".m4a", ".ogg", ".aac", ".wma", ".aiff"})
+
+
+def write_atomic(path: Path, data: str | bytes) -> None:
+    """
+    Write data to a temporary file and rename it into place, so an interrupted
+    write never leaves a truncated file behind. Text is written as UTF-8.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    if isinstance(data, str):
+        tmp_path.write_text(data, encoding="utf-8")
+    else:
+        tmp_path.write_bytes(data)
+    tmp_path.replace(path)
@@ -11,10 +11,22 @@ import io
 import json
 import logging
 import re
+import threading
+import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+import urllib3
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+
+from setlist_maker.editor import Track
+
+try:
+    import orjson  # Optional C-accelerated parser for API responses
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +39,64 @@ MAX_IMAGE_BYTES = 200_000
 # JPEG quality to start with when compressing
 JPEG_INITIAL_QUALITY = 90
 
+# JPEG quality used for the size probe that seeds the quality estimate
+JPEG_PROBE_QUALITY = 75
+
+# Lowest JPEG quality to try before falling back to a smaller image
+JPEG_MIN_QUALITY = 30
+
+# If the probe encode overshoots max_bytes by this factor, downscale up front
+JPEG_DOWNSCALE_RATIO = 1.5
+
+# Dimensions (square, pixels) used when downscaling high-detail artwork
+JPEG_DOWNSCALE_SIZE = 500
+
+# Number of tracks to fetch artwork for concurrently
+ARTWORK_FETCH_WORKERS = 8
+
+# Minimum seconds between MusicBrainz searches (their limit is 1 request/second per IP)
+MUSICBRAINZ_REQUEST_INTERVAL = 1.0
+
+# Dimension token in Shazam/Apple CDN cover art URLs, e.g. "400x400bb"
+_COVER_SIZE_RE = re.compile(r"\d+x\d+(?=bb|cc)")
+
+# Dimension tokens seen in nearly all Shazam URLs, rewritten without the regex
+_COMMON_COVER_SIZE_TOKENS = ("400x400bb", "400x400cc", "100x100bb", "100x100cc")
+
+# Shared connection pool so repeated requests to the same CDN/API host reuse
+# keep-alive sockets instead of paying a fresh TCP+TLS handshake each time
+_POOL = urllib3.PoolManager(
+    maxsize=8,
+    headers={"User-Agent": "setlist-maker/1.0"},
+    retries=urllib3.Retry(2),
+)
+
+# Cover Art Archive hands off to archive.org, which redirects again to a storage
+# node; total=None keeps the connect/read limits from capping the redirects
+_CAA_RETRIES = urllib3.Retry(total=None, connect=2, read=2, redirect=5)
+
+
+# Spaces MusicBrainz searches across the artwork worker threads
+_MUSICBRAINZ_LOCK = threading.Lock()
+_musicbrainz_next_request = 0.0
+
+
+def _wait_for_musicbrainz() -> None:
+    """Block until a MusicBrainz search is allowed under their rate limit."""
+    global _musicbrainz_next_request
+    with _MUSICBRAINZ_LOCK:
+        delay = _musicbrainz_next_request - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        _musicbrainz_next_request = time.monotonic() + MUSICBRAINZ_REQUEST_INTERVAL
+
+
+def _json_loads(data: bytes):
+    """Parse a JSON API response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def download_image(url: str, timeout: int = 15) -> bytes | None:
     """
@@ -40,9 +110,11 @@ def download_image(url: str, timeout: int = 15) -> bytes | None:
         Raw image bytes, or None if download failed.
     """
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "setlist-maker/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as response:
-            return response.read()
+        response = _POOL.request("GET", url, timeout=timeout)
+        if response.status != 200:
+            logger.debug("Failed to download image from %s: HTTP %s", url, response.status)
+            return None
+        return response.data
     except Exception as e:
         logger.debug("Failed to download image from %s: %s", url, e)
         return None
@@ -52,6 +124,9 @@ def search_itunes_artwork(artist: str, title: str, size: int = 600) -> str | Non
     """
     Search the iTunes API for album artwork.
 
+    Results are cached per (artist, title, size) for the lifetime of the process,
+    so repeated lookups of the same track don't hit the network again.
+
     Args:
         artist: Artist name.
         title: Track title.
@@ -60,6 +135,20 @@ def search_itunes_artwork(artist: str, title: str, size: int = 600) -> str | Non
     Returns:
         Artwork URL at the requested size, or None if not found.
     """
+    try:
+        return _itunes_lookup(artist.lower().strip(), title.lower().strip(), size)
+    except Exception as e:
+        logger.debug("iTunes artwork search failed for '%s %s': %s", artist, title, e)
+        return None
+
+
+@lru_cache(maxsize=512)
+def _itunes_lookup(artist: str, title: str, size: int) -> str | None:
+    """
+    Query the iTunes search API for a track's artwork URL.
+
+    Network and parse errors propagate so that failed lookups are not cached.
+    """
     search_term = f"{artist} {title}"
     params = urllib.parse.urlencode(
         {
@@ -70,18 +159,17 @@ def search_itunes_artwork(artist: str, title: str, size: int = 600) -> str | Non
     )
     url = f"https://itunes.apple.com/search?{params}"
 
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "setlist-maker/1.0"})
-        with urllib.request.urlopen(req, timeout=15) as response:
-            data = json.loads(response.read())
+    response = _POOL.request("GET", url, timeout=15)
+    if response.status != 200:
+        # Raise rather than return None, so throttling and outages aren't cached
+        raise urllib3.exceptions.HTTPError(f"HTTP {response.status}")
+    data = _json_loads(response.data)
 
-        if data.get("resultCount", 0) > 0:
-            result = data["results"][0]
-            artwork_url = result.get("artworkUrl100", "")
-            if artwork_url:
-                return artwork_url.replace("100x100bb", f"{size}x{size}bb")
-    except Exception as e:
-        logger.debug("iTunes artwork search failed for '%s %s': %s", artist, title, e)
+    if data.get("resultCount", 0) > 0:
+        result = data["results"][0]
+        artwork_url = result.get("artworkUrl100", "")
+        if artwork_url:
+            return artwork_url.replace("100x100bb", f"{size}x{size}bb")
 
     return None
 
@@ -100,7 +188,10 @@ def resize_cover_art_url(url: str, size: int = 600) -> str:
     Returns:
         URL with updated dimensions.
     """
-    return re.sub(r"\d+x\d+(?=bb|cc)", f"{size}x{size}", url)
+    for token in _COMMON_COVER_SIZE_TOKENS:
+        if token in url:
+            return url.replace(token, f"{size}x{size}{token[-2:]}")
+    return _COVER_SIZE_RE.sub(f"{size}x{size}", url)
 
 
 def _clean_query(text: str) -> str:
@@ -136,9 +227,13 @@ def search_deezer_artwork(artist: str, title: str, size: int = 600) -> str | Non
     url = f"https://api.deezer.com/search?{params}"
 
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "setlist-maker/1.0"})
-        with urllib.request.urlopen(req, timeout=15) as response:
-            data = json.loads(response.read())
+        response = _POOL.request("GET", url, timeout=15)
+        if response.status != 200:
+            logger.debug(
+                "Deezer artwork search failed for '%s %s': HTTP %s", artist, title, response.status
+            )
+            return None
+        data = _json_loads(response.data)
 
         if data.get("data") and len(data["data"]) > 0:
             album = data["data"][0].get("album", {})
@@ -179,9 +274,14 @@ def search_musicbrainz_artwork(artist: str, title: str) -> str | None:
     }
 
     try:
-        req = urllib.request.Request(mb_url, headers=headers)
-        with urllib.request.urlopen(req, timeout=15) as response:
-            data = json.loads(response.read())
+        _wait_for_musicbrainz()
+        response = _POOL.request("GET", mb_url, headers=headers, timeout=15)
+        if response.status != 200:
+            logger.debug(
+                "MusicBrainz search failed for '%s %s': HTTP %s", artist, title, response.status
+            )
+            return None
+        data = _json_loads(response.data)
 
         recordings = data.get("recordings", [])
         if not recordings:
@@ -201,10 +301,25 @@ def search_musicbrainz_artwork(artist: str, title: str) -> str | None:
     # Step 2: Get front cover from Cover Art Archive
     caa_url = f"https://coverartarchive.org/release/{release_id}/front-500"
     try:
-        req = urllib.request.Request(caa_url, headers=headers)
-        with urllib.request.urlopen(req, timeout=15) as response:
-            # Cover Art Archive redirects to the actual image URL
-            return response.url
+        # Cover Art Archive redirects to the actual image URL. The body is not
+        # read here (download_image fetches it), so the connection is closed
+        # rather than returned to the pool with unread data on it.
+        response = _POOL.request(
+            "GET",
+            caa_url,
+            headers=headers,
+            timeout=15,
+            retries=_CAA_RETRIES,
+            preload_content=False,
+        )
+        try:
+            if response.status != 200:
+                logger.debug("Cover Art Archive has no front cover for release %s", release_id)
+                return None
+            # Absolute redirect targets pass through; a relative one is resolved
+            return urllib.parse.urljoin(caa_url, response.geturl())
+        finally:
+            response.close()
     except Exception as e:
         logger.debug("Cover Art Archive lookup failed for release %s: %s", release_id, e)
         return None
@@ -273,18 +388,50 @@ def fetch_artwork(
     return None
 
 
-def _find_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+def fetch_artwork_batch(
+    tracks: list[Track],
+    size: int = CHAPTER_IMAGE_SIZE,
+    max_workers: int = ARTWORK_FETCH_WORKERS,
+) -> dict[int, bytes]:
     """
-    Find a usable bold sans-serif font on the system.
+    Fetch cover art for many tracks concurrently.
 
-    Tries common font paths across macOS, Linux, and Windows.
-    Falls back to Pillow's built-in default font.
+    Each track runs through the fetch_artwork waterfall on a worker thread;
+    the lookups are network-bound, so they overlap well. Unidentified tracks
+    are skipped.
 
     Args:
-        size: Desired font size in points.
+        tracks: Tracks to fetch artwork for.
+        size: Desired image size in pixels.
+        max_workers: Maximum number of concurrent fetches.
 
     Returns:
-        A Pillow font object.
+        Mapping of track index -> raw image bytes, for tracks where artwork was found.
+    """
+    indexed = [(i, t) for i, t in enumerate(tracks) if not t.is_unidentified]
+    if not indexed:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            i: executor.submit(fetch_artwork, t.artist, t.title, t.coverart_url, size)
+            for i, t in indexed
+        }
+        results = {i: future.result() for i, future in futures.items()}
+
+    return {i: data for i, data in results.items() if data}
+
+
+@lru_cache(maxsize=1)
+def _resolve_font_path() -> str | None:
+    """
+    Find a usable bold sans-serif font on the system.
+
+    Tries common font paths across macOS, Linux, and Windows, then a few font
+    names. The search runs once per process.
+
+    Returns:
+        A font path or name loadable by ImageFont.truetype, or None if none work.
     """
     # Common bold sans-serif fonts to try, in preference order
     font_candidates = [
@@ -305,20 +452,40 @@ def _find_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         # Windows
         "C:/Windows/Fonts/arialbd.ttf",
         "C:/Windows/Fonts/arial.ttf",
+        # Try by name (works on some systems)
+        "DejaVuSans-Bold",
+        "DejaVuSans",
+        "Arial",
+        "Helvetica",
     ]
 
     for font_path in font_candidates:
         try:
-            return ImageFont.truetype(font_path, size=size)
+            ImageFont.truetype(font_path, size=12)
+            return font_path
         except (OSError, IOError):
             continue
 
-    # Try by name (works on some systems)
-    for name in ["DejaVuSans-Bold", "DejaVuSans", "Arial", "Helvetica"]:
-        try:
-            return ImageFont.truetype(name, size=size)
-        except (OSError, IOError):
-            continue
+    return None
+
+
+@lru_cache(maxsize=32)
+def _find_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """
+    Load the system bold sans-serif font at the given size.
+
+    Falls back to Pillow's built-in default font. Results are cached per
+    size, since every chapter image asks for the same two fonts.
+
+    Args:
+        size: Desired font size in points.
+
+    Returns:
+        A Pillow font object.
+    """
+    font_path = _resolve_font_path()
+    if font_path is not None:
+        return ImageFont.truetype(font_path, size=size)
 
     # Last resort: Pillow's built-in font
     return ImageFont.load_default(size=size)
@@ -348,21 +515,25 @@ def create_chapter_image(
     # Load or create background
     if artwork_bytes:
         try:
-            base = Image.open(io.BytesIO(artwork_bytes)).convert("RGBA")
-            base = base.resize((size, size), Image.LANCZOS)
+            source = Image.open(io.BytesIO(artwork_bytes))
+            # Let libjpeg decode large JPEGs at a reduced scale (no-op for other formats)
+            source.draft("RGB", (size, size))
+            # Center-crop to square rather than stretching non-square artwork
+            base = ImageOps.fit(source.convert("RGBA"), (size, size), method=Image.LANCZOS)
         except Exception as e:
             logger.debug("Failed to load artwork image, using fallback: %s", e)
             base = _create_fallback_background(size)
     else:
         base = _create_fallback_background(size)
 
-    # Create transparent overlay for the lower-third bar
-    overlay = Image.new("RGBA", base.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
+    # Blend a semi-transparent lower-third bar (bottom ~28% of image) into the
+    # background in place, touching only the bar region
+    bar_top = _lower_third_top(size)
+    base.alpha_composite(_lower_third_bar(size), (0, bar_top))
 
-    # Draw semi-transparent lower-third bar (bottom ~28% of image)
-    bar_top = int(size * 0.72)
-    draw.rectangle([(0, bar_top), (size, size)], fill=(0, 0, 0, 170))
+    # Convert to RGB for JPEG and draw text directly onto it
+    result = base.convert("RGB")
+    draw = ImageDraw.Draw(result)
 
     # Load fonts
     title_font_size = max(size // 18, 16)
@@ -384,12 +555,20 @@ def create_chapter_image(
         draw, text_x, artist_y, artist, artist_font, size - 2 * padding, (200, 200, 200)
     )
 
-    # Composite and convert to RGB for JPEG
-    result = Image.alpha_composite(base, overlay).convert("RGB")
-
     return _compress_to_jpeg(result)
 
 
+def _lower_third_top(size: int) -> int:
+    """Return the y coordinate where the lower-third bar starts."""
+    return int(size * 0.72)
+
+
+@lru_cache(maxsize=8)
+def _lower_third_bar(size: int) -> Image.Image:
+    """Return the shared semi-transparent lower-third bar tile for an image size."""
+    return Image.new("RGBA", (size, size - _lower_third_top(size)), (0, 0, 0, 170))
+
+
 def _draw_text_fitted(
     draw: ImageDraw.ImageDraw,
     x: int,
@@ -407,44 +586,116 @@ def _draw_text_fitted(
         draw.text((x, y), text, font=font, fill=fill)
         return
 
-    # Truncate with ellipsis
-    for end in range(len(text) - 1, 0, -1):
-        truncated = text[:end] + "..."
-        bbox = draw.textbbox((0, 0), truncated, font=font)
-        if bbox[2] - bbox[0] <= max_width:
-            draw.text((x, y), truncated, font=font, fill=fill)
-            return
+    def fits(end: int) -> bool:
+        bbox = draw.textbbox((0, 0), text[:end] + "...", font=font)
+        return bbox[2] - bbox[0] <= max_width
+
+    # Binary search for the longest prefix that fits with an ellipsis
+    lo, hi = 1, len(text) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if fits(mid):
+            lo = mid
+        else:
+            hi = mid - 1
+
+    if fits(lo):
+        draw.text((x, y), text[:lo] + "...", font=font, fill=fill)
+        return
 
     draw.text((x, y), text[:3] + "...", font=font, fill=fill)
 
 
 def _create_fallback_background(size: int) -> Image.Image:
     """Create a dark gradient background when no artwork is available."""
-    img = Image.new("RGBA", (size, size), (30, 30, 40, 255))
-    draw = ImageDraw.Draw(img)
-    # Simple vertical gradient from dark blue-gray to darker
-    for y in range(size):
-        ratio = y / size
-        r = int(30 + 15 * ratio)
-        g = int(30 + 10 * ratio)
-        b = int(40 + 20 * ratio)
-        draw.line([(0, y), (size, y)], fill=(r, g, b, 255))
-    return img
+    # Simple vertical gradient from dark blue-gray to darker, built in one pass
+    ratio = (np.arange(size, dtype=np.float32) / size)[:, None]
+    rgba = np.empty((size, size, 4), dtype=np.uint8)
+    rgba[..., 0] = (30 + 15 * ratio).astype(np.uint8)
+    rgba[..., 1] = (30 + 10 * ratio).astype(np.uint8)
+    rgba[..., 2] = (40 + 20 * ratio).astype(np.uint8)
+    rgba[..., 3] = 255
+    return Image.fromarray(rgba, "RGBA")
+
+
+def _encode_jpeg(
+    image: Image.Image,
+    quality: int,
+    optimize: bool = False,
+    buf: io.BytesIO | None = None,
+) -> bytes:
+    """
+    Encode an image to JPEG bytes at the given quality.
 
+    Always uses 4:2:0 chroma subsampling. Optimized (final) encodes are also
+    progressive, which typically shrinks photographic artwork further.
 
-def _compress_to_jpeg(image: Image.Image, max_bytes: int = MAX_IMAGE_BYTES) -> bytes:
-    """Compress an image to JPEG, reducing quality until it fits under max_bytes."""
-    quality = JPEG_INITIAL_QUALITY
-    while quality >= 30:
+    Pass buf to reuse one buffer across repeated encodes. It is rewound before
+    writing and trimmed to the new length afterwards.
+    """
+    if buf is None:
         buf = io.BytesIO()
-        image.save(buf, format="JPEG", quality=quality, optimize=True)
-        data = buf.getvalue()
+    buf.seek(0)
+    image.save(
+        buf,
+        format="JPEG",
+        quality=quality,
+        optimize=optimize,
+        progressive=optimize,
+        subsampling=2,
+    )
+    buf.truncate()
+    return buf.getvalue()
+
+
+def _compress_to_jpeg(image: Image.Image, max_bytes: int = MAX_IMAGE_BYTES) -> bytes:
+    """
+    Compress an image to JPEG, choosing the highest quality that fits under max_bytes.
+
+    Most artwork fits at JPEG_INITIAL_QUALITY, so that is tried first as a single
+    final encode. Otherwise a probe encode at JPEG_PROBE_QUALITY seeds the search:
+    if it fits, quality is searched upward towards JPEG_INITIAL_QUALITY; if not,
+    the target quality is estimated from the probe's size. Images whose probe is
+    far over budget are downscaled to JPEG_DOWNSCALE_SIZE first. Only final
+    encodes use the (slower) Huffman table optimization.
+    """
+    # One buffer is reused for every attempt instead of reallocating per encode
+    buf = io.BytesIO()
+    data = _encode_jpeg(image, JPEG_INITIAL_QUALITY, optimize=True, buf=buf)
+    if len(data) <= max_bytes:
+        return data
+
+    # The initial quality is known not to fit unless the image gets downscaled
+    max_quality = JPEG_INITIAL_QUALITY - 1
+    probe_size = len(_encode_jpeg(image, JPEG_PROBE_QUALITY, buf=buf))
+
+    # High-detail artwork would only fit at very low quality; shrink it first
+    if probe_size > max_bytes * JPEG_DOWNSCALE_RATIO and image.width > JPEG_DOWNSCALE_SIZE:
+        image = image.resize((JPEG_DOWNSCALE_SIZE, JPEG_DOWNSCALE_SIZE), Image.LANCZOS)
+        probe_size = len(_encode_jpeg(image, JPEG_PROBE_QUALITY, buf=buf))
+        max_quality = JPEG_INITIAL_QUALITY
+
+    if probe_size <= max_bytes:
+        # Binary search between the probe (fits) and the highest untested quality
+        lo, hi = JPEG_PROBE_QUALITY, max_quality
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if len(_encode_jpeg(image, mid, buf=buf)) <= max_bytes:
+                lo = mid
+            else:
+                hi = mid - 1
+        quality = lo
+    else:
+        # File size grows roughly with the square of quality in this range
+        quality = int(JPEG_PROBE_QUALITY * (max_bytes / probe_size) ** 0.5)
+        quality = max(JPEG_MIN_QUALITY, min(quality, JPEG_PROBE_QUALITY - 1))
+
+    while quality >= JPEG_MIN_QUALITY:
+        data = _encode_jpeg(image, quality, optimize=True, buf=buf)
         if len(data) <= max_bytes:
             return data
         quality -= 10
 
     # If still too large, reduce dimensions
     smaller = image.resize((400, 400), Image.LANCZOS)
-    buf = io.BytesIO()
-    smaller.save(buf, format="JPEG", quality=60, optimize=True)
-    return buf.getvalue()
+    return _encode_jpeg(smaller, 60, optimize=True, buf=buf)
@@ -0,0 +1,96 @@
+"""
+Persistent cache of Shazam recognition results.
+
+Results are keyed by a SHA-256 hash of the exact PCM samples sent to Shazam,
+so re-running on the same recording (or resuming after a crash) reuses earlier
+answers instead of spending API calls on them again.
+"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from setlist_maker import write_atomic
+
+# How long a "no match" answer is trusted before the audio is sent to Shazam
+# again; its catalogue keeps growing, so unidentified tracks deserve a retry
+NO_MATCH_TTL = timedelta(days=30)
+
+
+class RecognitionCache:
+    """
+    Database of Shazam results keyed by audio content hash.
+
+    Both matches and "no match" answers are stored; failed requests (network
+    errors, rate limits) are never cached. "No match" answers expire after
+    no_match_ttl.
+    """
+
+    def __init__(self, cache_path: Path | None = None, no_match_ttl: timedelta = NO_MATCH_TTL):
+        if cache_path is None:
+            # Default to ~/.config/setlist-maker/recognitions.json
+            config_dir = Path.home() / ".config" / "setlist-maker"
+            config_dir.mkdir(parents=True, exist_ok=True)
+            cache_path = config_dir / "recognitions.json"
+
+        self.cache_path = cache_path
+        self.no_match_ttl = no_match_ttl
+        self.entries: dict[str, dict] = {}
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def fingerprint(samples: np.ndarray) -> str:
+        """Hash a slice of PCM samples into a cache key."""
+        return hashlib.sha256(np.ascontiguousarray(samples).data).hexdigest()
+
+    def _load(self) -> None:
+        """Load cached results from disk."""
+        if self.cache_path.exists():
+            try:
+                with open(self.cache_path) as f:
+                    data = json.load(f)
+                    self.entries = data.get("recognitions", {})
+            except (json.JSONDecodeError, IOError):
+                self.entries = {}
+
+    def save(self) -> None:
+        """
+        Save cached results to disk if anything was added.
+        Written to a temporary file and renamed into place, so an interrupted
+        save cannot corrupt (and thereby empty) the whole cache.
+        """
+        if not self._dirty:
+            return
+        write_atomic(self.cache_path, json.dumps({"recognitions": self.entries}))
+        self._dirty = False
+
+    def __contains__(self, key: str) -> bool:
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        return entry["track"] is not None or not self._expired(entry)
+
+    def _expired(self, entry: dict) -> bool:
+        """Check whether a "no match" entry is older than no_match_ttl."""
+        try:
+            cached_at = datetime.fromisoformat(entry["cached_at"])
+        except (KeyError, TypeError, ValueError):
+            return True
+        return datetime.now() - cached_at > self.no_match_ttl
+
+    def get(self, key: str) -> dict | None:
+        """Return the cached track info for a key (None for a cached "no match")."""
+        entry = self.entries.get(key)
+        return entry["track"] if entry else None
+
+    def add(self, key: str, track_info: dict | None) -> None:
+        """Record the result of a successful recognition request."""
+        self.entries[key] = {
+            "track": track_info,
+            "cached_at": datetime.now().isoformat(),
+        }
+        self._dirty = True
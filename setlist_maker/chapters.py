@@ -11,11 +11,17 @@ ID3v2 Chapter Frame Addendum v1.0 specification.
 
 from pathlib import Path
 
+from mutagen import PaddingInfo
 from mutagen.id3 import APIC, CHAP, CTOC, TIT2, CTOCFlags, Encoding, PictureType
 from mutagen.mp3 import MP3
 
 from setlist_maker.editor import Track
 
+# ID3 padding (bytes) reserved whenever the chapter tag outgrows the existing
+# padding and the file has to be rewritten anyway. Leaves room for re-embedding
+# after small tracklist edits without another full-file rewrite.
+CHAPTER_TAG_PADDING = 512 * 1024
+
 
 def embed_chapters(
     audio_path: Path,
@@ -66,38 +72,35 @@ def embed_chapters(
     # Remove any existing chapter-related frames
     _remove_existing_chapters(audio)
 
-    # Add episode-level artwork before chapters so delall("APIC") doesn't
-    # risk interfering with CHAP sub-frames
+    # Replace episode-level artwork before chapters so it doesn't risk
+    # interfering with CHAP sub-frames
     if episode_image:
-        audio.tags.delall("APIC")
-        audio.tags.add(
-            APIC(
-                encoding=3,
-                mime="image/jpeg",
-                type=PictureType.COVER_FRONT,
-                desc="Episode Cover",
-                data=episode_image,
-            )
+        audio.tags.setall(
+            "APIC",
+            [
+                APIC(
+                    encoding=3,
+                    mime="image/jpeg",
+                    type=PictureType.COVER_FRONT,
+                    desc="Episode Cover",
+                    data=episode_image,
+                )
+            ],
         )
 
-    # Build chapter element IDs
+    # Build chapter element IDs, boundaries, and titles up front. Each chapter
+    # ends where the next one starts; the last one ends with the audio.
     chapter_ids = [f"chp{i:03d}" for i in range(len(tracks))]
+    boundaries_ms = [track.timestamp * 1000 for track in tracks]
+    boundaries_ms.append(audio_duration_ms)
+    chapter_titles = [
+        "Unknown Track" if track.is_unidentified else f"{track.artist} - {track.title}"
+        for track in tracks
+    ]
 
     # Add CHAP frames for each track
-    for i, track in enumerate(tracks):
-        start_ms = track.timestamp * 1000
-
-        # End time is start of next track, or audio end for last track
-        if i + 1 < len(tracks):
-            end_ms = tracks[i + 1].timestamp * 1000
-        else:
-            end_ms = audio_duration_ms
-
-        # Build chapter title
-        if track.is_unidentified:
-            chapter_title = "Unknown Track"
-        else:
-            chapter_title = f"{track.artist} - {track.title}"
+    for i, chapter_title in enumerate(chapter_titles):
+        start_ms, end_ms = boundaries_ms[i], boundaries_ms[i + 1]
 
         # Build sub-frames
         sub_frames = [
@@ -137,16 +140,28 @@ def embed_chapters(
         )
     )
 
-    audio.save()
+    audio.save(padding=_chapter_padding)
     return audio_path
 
 
+def _chapter_padding(info: PaddingInfo) -> int:
+    """
+    Choose ID3 padding so chapter updates avoid rewriting the whole MP3.
+
+    If the new tag fits in the existing padding, keep it as is so the tag is
+    updated in place (mutagen's default would shrink oversized padding, which
+    forces a rewrite of the entire audio stream). Otherwise reserve generous
+    padding for the next save.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return max(info.get_default_padding(), CHAPTER_TAG_PADDING)
+
+
 def _remove_existing_chapters(audio: MP3) -> None:
     """Remove any existing CHAP and CTOC frames from the file."""
     if audio.tags is None:
         return
 
-    # Collect keys to delete (can't modify dict during iteration)
-    to_delete = [key for key in audio.tags if key.startswith(("CHAP:", "CTOC:"))]
-    for key in to_delete:
-        del audio.tags[key]
+    audio.tags.delall("CHAP")
+    audio.tags.delall("CTOC")
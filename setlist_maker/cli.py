@@ -49,18 +49,28 @@ Usage:
 
 import argparse
 import asyncio
+import hashlib
+import io
 import json
+import os
 import random
 import sys
-import tempfile
-from datetime import datetime
+import wave
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, nullcontext
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
 from pathlib import Path
 
-from pydub import AudioSegment
+import numpy as np
 from shazamio import Shazam
 
-from setlist_maker import AUDIO_EXTENSIONS, __version__
-from setlist_maker.artwork import create_chapter_image, fetch_artwork
+from setlist_maker import AUDIO_EXTENSIONS, __version__, write_atomic
+from setlist_maker.artwork import create_chapter_image, fetch_artwork_batch
+from setlist_maker.cache import RecognitionCache
 from setlist_maker.chapters import embed_chapters
 from setlist_maker.editor import (
     CorrectionsDB,
@@ -76,6 +86,7 @@ from setlist_maker.processor import (
     ProcessingConfig,
     analyze_audio,
     check_ffmpeg,
+    decode_audio,
     get_audio_duration,
     process_audio,
 )
@@ -83,21 +94,58 @@ from setlist_maker.stage_picker import Stage, run_stage_picker
 
 # Configuration
 SAMPLE_DURATION_MS = 30 * 1000  # 30 seconds in milliseconds
-DEFAULT_DELAY_SECONDS = 15  # Pause between API calls
+SHAZAM_SAMPLE_RATE = 16000  # Sample rate of the audio sent to Shazam
+DEFAULT_DELAY_SECONDS = 15  # Minimum spacing between API call starts
+DEFAULT_CONCURRENCY = 4  # Maximum Shazam requests in flight at once
+DEFAULT_BURST = 1  # Requests that may start back to back before spacing applies
+DEFAULT_SILENCE_DB = -50.0  # Samples quieter than this (RMS, dBFS) are not sent
+PROBE_WORKERS = 8  # Parallel ffprobe calls when listing input files
+PROGRESS_CHECKPOINT_INTERVAL = 10  # Results between progress file writes
 MAX_RETRIES = 5
 INITIAL_BACKOFF = 30
+MAX_BACKOFF = 300  # Upper bound on a single rate-limit wait
+
+
+class RateLimiter:
+    """
+    Spaces out API calls so that on average one starts every `interval` seconds.
+
+    A token bucket: up to `burst` calls may start back to back after an idle
+    period, after which starts are spaced `interval` apart again. Safe to share
+    between concurrent tasks; waiters are released in order.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = burst
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def wait(self) -> None:
+        """Block until the next call is allowed to start."""
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            # _next_start is when the bucket would be empty again; earlier
+            # starts are allowed while tokens remain
+            next_start = max(self._next_start, now)
+            allowed_at = next_start - (self.burst - 1) * self.interval
+            if allowed_at > now:
+                await asyncio.sleep(allowed_at - now)
+            self._next_start = next_start + self.interval
+
+
+_TWO_DIGITS = tuple(f"{n:02d}" for n in range(60))
 
 
 def format_timestamp(seconds: int) -> str:
     """Convert seconds to HH:MM:SS or MM:SS format."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
 
     if hours > 0:
-        return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{hours}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[secs]}"
     else:
-        return f"{minutes}:{secs:02d}"
+        return f"{minutes}:{_TWO_DIGITS[secs]}"
 
 
 def get_audio_files(paths: list[str]) -> list[Path]:
@@ -109,10 +157,16 @@ def get_audio_files(paths: list[str]) -> list[Path]:
     for path_str in paths:
         path = Path(path_str)
         if path.is_dir():
-            # Get all audio files in directory (non-recursive)
-            for file in sorted(path.iterdir()):
-                if file.is_file() and file.suffix.lower() in AUDIO_EXTENSIONS:
-                    audio_files.append(file)
+            # Get all audio files in directory (non-recursive). scandir entries
+            # answer is_file() from the directory listing without a stat per file
+            with os.scandir(path) as entries:
+                names = sorted(
+                    entry.name
+                    for entry in entries
+                    if entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS
+                )
+            audio_files.extend(path / name for name in names)
         elif path.is_file():
             if path.suffix.lower() in AUDIO_EXTENSIONS:
                 audio_files.append(path)
@@ -123,86 +177,193 @@ def get_audio_files(paths: list[str]) -> list[Path]:
     return audio_files
 
 
-def load_audio(filepath: Path) -> AudioSegment:
-    """Load an audio file using pydub."""
+def load_audio(filepath: Path, audio: np.ndarray | None = None) -> np.ndarray:
+    """
+    Decode an audio file to mono PCM samples at SHAZAM_SAMPLE_RATE.
+    Pass samples that were already decoded (e.g. prefetched) to skip decoding.
+    """
     print(f"Loading audio file: {filepath.name}")
-    audio = AudioSegment.from_file(str(filepath))
-    duration_sec = len(audio) // 1000
+    if audio is None:
+        audio = decode_audio(filepath, SHAZAM_SAMPLE_RATE)
+    duration_sec = len(audio) // SHAZAM_SAMPLE_RATE
     print(f"  Duration: {format_timestamp(duration_sec)} ({duration_sec} seconds)")
     return audio
 
 
-def slice_audio(audio: AudioSegment, sample_duration_ms: int) -> list[tuple[int, AudioSegment]]:
+def slice_audio(audio: np.ndarray, sample_duration_ms: int) -> Iterator[tuple[int, np.ndarray]]:
     """
     Slice audio into consecutive chunks.
-    Returns list of (start_time_seconds, audio_segment) tuples.
+    Yields (start_time_seconds, samples) tuples; the samples are views into the
+    original array, not copies.
     """
-    slices = []
-    total_ms = len(audio)
-    position = 0
+    samples_per_slice = SHAZAM_SAMPLE_RATE * sample_duration_ms // 1000
+    for position in range(0, len(audio), samples_per_slice):
+        yield position // SHAZAM_SAMPLE_RATE, audio[position : position + samples_per_slice]
 
-    while position < total_ms:
-        end_position = min(position + sample_duration_ms, total_ms)
-        segment = audio[position:end_position]
-        start_seconds = position // 1000
-        slices.append((start_seconds, segment))
-        position = end_position
 
-    print(f"  Created {len(slices)} samples of {sample_duration_ms // 1000} seconds each")
-    return slices
+def slice_levels_db(slices: Iterable[tuple[int, np.ndarray]]) -> np.ndarray:
+    """
+    RMS level of each slice in dBFS (0 dB = full-scale 16-bit).
+    Empty or all-zero slices come out as -inf.
+    """
+    rms = np.array(
+        [
+            np.sqrt(np.mean(np.square(segment, dtype=np.float32))) if len(segment) else 0.0
+            for _, segment in slices
+        ]
+    )
+    with np.errstate(divide="ignore"):
+        return 20 * np.log10(rms / 32768)
+
+
+def segment_to_wav(segment: np.ndarray) -> bytes:
+    """Wrap mono 16-bit samples at SHAZAM_SAMPLE_RATE in an in-memory WAV for Shazam."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SHAZAM_SAMPLE_RATE)
+        # Write straight from the sample buffer instead of copying it to bytes first
+        wav.writeframes(memoryview(np.ascontiguousarray(segment)).cast("B"))
+    return buf.getvalue()
+
+
+class RecognitionError(Exception):
+    """Raised when a Shazam request fails (after any retries)."""
+
+    pass
 
 
 async def identify_sample_with_retry(
-    shazam: Shazam, segment: AudioSegment, temp_dir: str, max_retries: int = MAX_RETRIES
+    shazam: Shazam,
+    segment: np.ndarray,
+    max_retries: int = MAX_RETRIES,
+    cache: RecognitionCache | None = None,
+    throttle: Callable[[], AbstractAsyncContextManager] | None = None,
 ) -> dict | None:
     """
     Identify a single audio segment using Shazam with exponential backoff retry.
     Returns track info dict or None if not identified.
+
+    If a cache is given, previously seen audio is answered from it and new
+    results (including "no match") are added to it.
+
+    If a throttle is given, only the Shazam request itself runs inside it; the
+    cache lookup and WAV encoding happen beforehand, so cache hits never wait
+    for a request slot and encoding overlaps other requests in flight.
+    """
+    key = None
+    if cache is not None:
+        key = cache.fingerprint(segment)
+        if key in cache:
+            return cache.get(key)
+
+    data = segment_to_wav(segment)
+    try:
+        async with throttle() if throttle else nullcontext():
+            track_info = await _recognize_with_retry(shazam, data, max_retries)
+    except RecognitionError:
+        return None
+
+    if cache is not None:
+        cache.add(key, track_info)
+    return track_info
+
+
+async def _recognize_with_retry(shazam: Shazam, data: bytes, max_retries: int) -> dict | None:
     """
-    temp_path = str(Path(temp_dir) / "temp_sample.mp3")
-    segment.export(temp_path, format="mp3")
+    Send WAV data to Shazam, backing off on rate limits.
 
+    Raises:
+        RecognitionError: If the request fails or stays rate limited.
+    """
     backoff = INITIAL_BACKOFF
     for attempt in range(max_retries):
         try:
-            result = await shazam.recognize(temp_path)
+            result = await shazam.recognize(data)
             if result and "track" in result:
-                track = result["track"]
-                images = track.get("images", {})
-                return {
-                    "title": track.get("title", "Unknown Title"),
-                    "artist": track.get("subtitle", "Unknown Artist"),
-                    "shazam_url": track.get("url"),
-                    "album": track.get("sections", [{}])[0].get("metadata", [{}])[0].get("text")
-                    if track.get("sections")
-                    else None,
-                    "coverart_url": images.get("coverarthq") or images.get("coverart"),
-                }
+                return _parse_track(result["track"])
             return None
         except Exception as e:
             error_str = str(e).lower()
 
             # Check if it's a rate limit error
-            if "429" in error_str or "too many" in error_str or "rate" in error_str:
+            if (
+                getattr(e, "status", None) == 429
+                or "429" in error_str
+                or "too many" in error_str
+                or "rate" in error_str
+            ):
                 if attempt < max_retries - 1:
-                    # Add jitter to avoid thundering herd
-                    jitter = random.uniform(0, backoff * 0.1)
-                    wait_time = backoff + jitter
+                    retry_after = _retry_after_seconds(e)
+                    if retry_after is not None:
+                        # The server said how long to wait (capped like the backoff,
+                        # so a bogus header cannot stall the run); the backoff is left
+                        # alone for any later limit that comes without the header
+                        wait_time = min(MAX_BACKOFF, retry_after)
+                    else:
+                        # Decorrelated jitter: each wait is drawn from
+                        # [INITIAL_BACKOFF, 3 * previous wait], so concurrent
+                        # requests that were limited together retry apart
+                        wait_time = min(MAX_BACKOFF, random.uniform(INITIAL_BACKOFF, backoff * 3))
+                        backoff = wait_time
                     print(
                         f"\n  Warning: Rate limited. Backing off for {wait_time:.0f} seconds "
                         f"(attempt {attempt + 1}/{max_retries})..."
                     )
                     await asyncio.sleep(wait_time)
-                    backoff *= 2  # Exponential backoff
                 else:
                     print(f"\n  Error: Rate limit persisted after {max_retries} attempts")
-                    return None
+                    raise RecognitionError("rate limited") from e
             else:
-                # Other error - log and return None
+                # Other error - log and give up on this sample
                 print(f"\n  Error during recognition: {e}")
-                return None
+                raise RecognitionError(str(e)) from e
+
+    raise RecognitionError("no attempts made")
+
+
+def _parse_track(track: dict) -> dict:
+    """Extract the fields we keep from a Shazam track match."""
+    album = None
+    sections = track.get("sections")
+    if sections:
+        metadata = sections[0].get("metadata")
+        if metadata:
+            album = metadata[0].get("text")
 
-    return None
+    images = track.get("images") or {}
+    return {
+        "title": track.get("title", "Unknown Title"),
+        "artist": track.get("subtitle", "Unknown Artist"),
+        "shazam_url": track.get("url"),
+        "album": album,
+        "coverart_url": images.get("coverarthq") or images.get("coverart"),
+    }
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """
+    Seconds to wait according to the Retry-After header on an HTTP error.
+    Handles both delay-seconds and HTTP-date forms; returns None if absent.
+    """
+    headers = getattr(error, "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 def deduplicate_tracklist(
@@ -213,40 +374,26 @@ def deduplicate_tracklist(
     1. Remove singletons (tracks appearing only once - likely samples)
     2. Collapse consecutive identical matches
     """
-    # Count occurrences of each track
-    track_counts: dict[tuple[str, str], int] = {}
-    for timestamp, track_info in raw_results:
-        if track_info:
-            key = (track_info["title"].lower(), track_info["artist"].lower())
-            track_counts[key] = track_counts.get(key, 0) + 1
-
-    # Filter: replace singletons with None (treat as unidentified)
-    filtered_results = []
-    for timestamp, track_info in raw_results:
-        if track_info:
-            key = (track_info["title"].lower(), track_info["artist"].lower())
-            if track_counts[key] == 1:
-                filtered_results.append((timestamp, None))  # Singleton = unidentified
-            else:
-                filtered_results.append((timestamp, track_info))
-        else:
-            filtered_results.append((timestamp, None))
-
-    # Apply consecutive deduplication
+    # Compute each sample's comparison key once
+    keys = [
+        (track_info["title"].casefold(), track_info["artist"].casefold()) if track_info else None
+        for _, track_info in raw_results
+    ]
+    track_counts = Counter(key for key in keys if key)
+
+    # Single pass: singletons are treated as unidentified (likely samples),
+    # then consecutive identical matches are collapsed
     tracklist = []
     last_track_key = None
     pending_unidentified = None
 
-    for timestamp, track_info in filtered_results:
-        if track_info is None:
+    for (timestamp, track_info), track_key in zip(raw_results, keys):
+        if track_key is None or track_counts[track_key] == 1:
             # Track unidentified samples but don't add until we see a change
             if last_track_key is not None and pending_unidentified is None:
                 pending_unidentified = timestamp
             continue
 
-        # Create a key for comparison
-        track_key = (track_info["title"].lower(), track_info["artist"].lower())
-
         if track_key != last_track_key:
             # If there was an unidentified gap, add it
             if pending_unidentified is not None:
@@ -274,12 +421,16 @@ def results_to_tracklist(
     """
     # Apply corrections before deduplication
     if corrections_db:
+        # Consecutive samples mostly repeat the same match, so look up each
+        # distinct artist/title pair only once
+        corrections = {
+            pair: corrections_db.get_correction(*pair)
+            for pair in {(info["artist"], info["title"]) for _, info in raw_results if info}
+        }
         corrected_results = []
         for timestamp, track_info in raw_results:
             if track_info:
-                correction = corrections_db.get_correction(
-                    track_info["artist"], track_info["title"]
-                )
+                correction = corrections[(track_info["artist"], track_info["title"])]
                 if correction:
                     track_info = track_info.copy()
                     track_info["original_artist"] = track_info["artist"]
@@ -316,20 +467,48 @@ def results_to_tracklist(
     )
 
 
+def _progress_lines(results: list) -> str:
+    """Serialize results as JSON Lines, one [timestamp, track_info] per line."""
+    return "".join(json.dumps([ts, info], separators=(",", ":")) + "\n" for ts, info in results)
+
+
 def save_progress(results: list, filepath: Path):
-    """Save intermediate results to JSON in case of interruption."""
-    # Convert to serializable format
-    serializable = [(ts, info) for ts, info in results]
-    with open(filepath, "w") as f:
-        json.dump(serializable, f, indent=2)
+    """Save intermediate results as JSON Lines in case of interruption."""
+    write_atomic(filepath, _progress_lines(results))
+
+
+def append_progress(results: list, filepath: Path):
+    """Append newly finished results to a progress file written by save_progress."""
+    with open(filepath, "a", encoding="utf-8") as f:
+        f.write(_progress_lines(results))
 
 
 def load_progress(filepath: Path) -> list:
-    """Load previous progress if it exists."""
-    if filepath.exists():
-        with open(filepath, "r") as f:
-            return json.load(f)
-    return []
+    """
+    Load previous progress if it exists.
+    Stops at the first unreadable line (a write cut short by an interruption).
+    Progress files in the older single-array format are read as well.
+    """
+    if not filepath.exists():
+        return []
+    text = filepath.read_text(encoding="utf-8")
+
+    # Older versions wrote one indented JSON array of [timestamp, track_info] pairs
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    else:
+        if isinstance(data, list) and all(isinstance(item, list) for item in data):
+            return data
+
+    results = []
+    for line in text.splitlines():
+        try:
+            results.append(json.loads(line))
+        except json.JSONDecodeError:
+            break
+    return results
 
 
 async def process_single_file(
@@ -338,10 +517,19 @@ async def process_single_file(
     delay_seconds: int,
     resume: bool = True,
     corrections_db: CorrectionsDB | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    recognition_cache: RecognitionCache | None = None,
+    silence_db: float = DEFAULT_SILENCE_DB,
+    shazam: Shazam | None = None,
+    burst: int = DEFAULT_BURST,
+    audio: np.ndarray | None = None,
 ) -> tuple[Tracklist, Path] | None:
     """
     Process a single audio file and generate its tracklist.
     Returns (Tracklist, output_path) on success, None on failure.
+
+    Pass a shared Shazam client when processing several files; one is created
+    if omitted. Pass already-decoded samples to skip decoding the file.
     """
     print(f"\n{'=' * 60}")
     print(f"Processing: {audio_path.name}")
@@ -357,49 +545,102 @@ async def process_single_file(
         output_path = audio_path.parent / f"{base_name}_tracklist.md"
         progress_path = audio_path.parent / f"{base_name}_progress.json"
 
-    # Load audio and create slices
+    # Load audio and create slices. Blocking file work runs in worker threads
+    # so the event loop stays free for in-flight requests
     try:
-        audio = load_audio(audio_path)
+        audio = await asyncio.to_thread(load_audio, audio_path, audio)
     except Exception as e:
         print(f"  Error: Failed to load audio: {e}")
         return None
 
-    slices = slice_audio(audio, SAMPLE_DURATION_MS)
+    # Near-silent slices (intros, gaps between files) can never identify, so they
+    # are recorded as unidentified without spending an API call
+    silent = slice_levels_db(slice_audio(audio, SAMPLE_DURATION_MS)) < silence_db
+    total_slices = len(silent)
+    print(f"  Created {total_slices} samples of {SAMPLE_DURATION_MS // 1000} seconds each")
 
     # Check for existing progress
     raw_results = []
     start_index = 0
     if resume and progress_path.exists():
-        raw_results = load_progress(progress_path)
+        raw_results = await asyncio.to_thread(load_progress, progress_path)
         start_index = len(raw_results)
         if start_index > 0:
             print(f"  Resuming from sample {start_index + 1} ({start_index} previous results)")
 
+    # Start the progress file from exactly what was loaded (dropping any stale run
+    # or torn last line) so later checkpoints can simply append
+    await asyncio.to_thread(save_progress, raw_results, progress_path)
+
     # Initialize Shazam
-    shazam = Shazam()
+    if shazam is None:
+        shazam = Shazam()
+
+    # Identify slices concurrently: the semaphore bounds requests in flight and
+    # the rate limiter keeps starts at least delay_seconds apart. Up to
+    # `concurrency` further samples are prepared (cache lookup, WAV encoding)
+    # ahead of time so they are ready the moment a request slot frees up.
+    semaphore = asyncio.Semaphore(concurrency)
+    lookahead = asyncio.Semaphore(2 * concurrency)
+    limiter = RateLimiter(delay_seconds, burst)
+
+    @asynccontextmanager
+    async def throttle():
+        async with semaphore:
+            await limiter.wait()
+            yield
+
+    async def identify(index: int, timestamp: int, segment: np.ndarray):
+        if silent[index]:
+            return index, timestamp, None
+        async with lookahead:
+            track_info = await identify_sample_with_retry(
+                shazam, segment, cache=recognition_cache, throttle=throttle
+            )
+        return index, timestamp, track_info
 
-    # Process each slice
-    total_slices = len(slices)
-    with tempfile.TemporaryDirectory() as temp_dir:
-        for i, (timestamp, segment) in enumerate(slices[start_index:], start_index + 1):
-            time_str = format_timestamp(timestamp)
-            print(f"  [{i}/{total_slices}] Sample at {time_str}")
+    # Results may finish out of order; only the contiguous prefix is checkpointed
+    # so that resuming can keep using len(raw_results) as the restart index
+    finished: dict[int, tuple[int, dict | None]] = {}
+    checkpointed = len(raw_results)
 
-            track_info = await identify_sample_with_retry(shazam, segment, temp_dir)
+    tasks = [
+        asyncio.create_task(identify(i, timestamp, segment))
+        for i, (timestamp, segment) in enumerate(
+            islice(slice_audio(audio, SAMPLE_DURATION_MS), start_index, None), start_index
+        )
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            i, timestamp, track_info = await next_done
+            time_str = format_timestamp(timestamp)
+            print(f"  [{i + 1}/{total_slices}] Sample at {time_str}")
 
             if track_info:
                 print(f"  Found: {track_info['artist']} - {track_info['title']}")
+            elif silent[i]:
+                print("  Skipped (silence)")
             else:
                 print("  Not identified")
 
-            raw_results.append((timestamp, track_info))
-
-            # Save progress after each sample
-            save_progress(raw_results, progress_path)
-
-            # Delay before next request (except for the last one)
-            if i < total_slices:
-                await asyncio.sleep(delay_seconds)
+            finished[i] = (timestamp, track_info)
+            while len(raw_results) in finished:
+                raw_results.append(finished.pop(len(raw_results)))
+
+            # Checkpoint every few samples, off the event loop
+            if len(raw_results) - checkpointed >= PROGRESS_CHECKPOINT_INTERVAL:
+                await asyncio.to_thread(append_progress, raw_results[checkpointed:], progress_path)
+                checkpointed = len(raw_results)
+    except BaseException:
+        # Interrupted or failed: keep what finished so the next run resumes from it
+        if len(raw_results) > checkpointed:
+            append_progress(raw_results[checkpointed:], progress_path)
+        raise
+    finally:
+        for task in tasks:
+            task.cancel()
+        if recognition_cache is not None:
+            recognition_cache.save()
 
     # Convert to Tracklist with corrections applied
     print("\n  Processing complete. Generating tracklist...")
@@ -409,15 +650,13 @@ async def process_single_file(
     markdown = tracklist.to_markdown()
 
     # Write output
-    with open(output_path, "w") as f:
-        f.write(markdown)
+    await asyncio.to_thread(write_atomic, output_path, markdown)
 
     print(f"  Saved: {output_path}")
     print(f"  Found {len(tracklist.tracks)} unique tracks")
 
     # Clean up progress file
-    if progress_path.exists():
-        progress_path.unlink()
+    await asyncio.to_thread(progress_path.unlink, missing_ok=True)
 
     return tracklist, output_path
 
@@ -429,14 +668,21 @@ async def process_batch(
     resume: bool = True,
     open_editor: bool = False,
     use_corrections: bool = True,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+    silence_db: float = DEFAULT_SILENCE_DB,
+    burst: int = DEFAULT_BURST,
 ) -> list[tuple[Tracklist, Path]]:
     """Process multiple audio files in sequence."""
     corrections_db = CorrectionsDB() if use_corrections else None
+    recognition_cache = RecognitionCache() if use_cache else None
+    shazam = Shazam()
 
     total_files = len(audio_files)
     print(f"\n{'#' * 60}")
     print(f"# Batch Processing: {total_files} file(s)")
     print(f"# Delay between samples: {delay_seconds} seconds")
+    print(f"# Concurrent requests: {concurrency}")
     if output_dir:
         print(f"# Output directory: {output_dir}")
     if use_corrections:
@@ -444,14 +690,37 @@ async def process_batch(
     print(f"{'#' * 60}")
 
     results = []
+    prefetch: asyncio.Task | None = None
     for idx, file in enumerate(audio_files, 1):
         print(f"\n[File {idx}/{total_files}]")
+
+        audio = None
+        if prefetch is not None:
+            try:
+                audio = await prefetch
+            except Exception:
+                pass  # process_single_file decodes again and reports the error
+
+        # Decode the next file in the background while this one is identified,
+        # which is mostly spent waiting on the Shazam rate limit
+        prefetch = None
+        if idx < total_files:
+            prefetch = asyncio.create_task(
+                asyncio.to_thread(decode_audio, audio_files[idx], SHAZAM_SAMPLE_RATE)
+            )
+
         result = await process_single_file(
             audio_path=file,
             output_dir=output_dir,
             delay_seconds=delay_seconds,
             resume=resume,
             corrections_db=corrections_db,
+            concurrency=concurrency,
+            recognition_cache=recognition_cache,
+            silence_db=silence_db,
+            shazam=shazam,
+            burst=burst,
+            audio=audio,
         )
 
         if result:
@@ -590,8 +859,10 @@ def cmd_process(args: argparse.Namespace) -> None:
     print(f"{'=' * 60}")
     print(f"\nInput files ({len(input_files)}):")
     total_duration = 0.0
-    for f in input_files:
-        duration = get_audio_duration(f)
+    # Each probe is a separate ffprobe process, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(input_files))) as pool:
+        durations = list(pool.map(get_audio_duration, input_files))
+    for f, duration in zip(input_files, durations):
         if duration:
             total_duration += duration
             print(f"  - {f.name} ({format_duration(duration)})")
@@ -672,7 +943,7 @@ def cmd_process(args: argparse.Namespace) -> None:
             input_files=input_files,
             output_file=output_path,
             config=config,
-            verbose=args.verbose if hasattr(args, "verbose") else False,
+            verbose=args.verbose,
         )
         print(f"\n✓ Output saved: {result_path}")
 
@@ -700,6 +971,7 @@ def cmd_process(args: argparse.Namespace) -> None:
         print(f"{'=' * 60}")
 
         corrections_db = CorrectionsDB() if not args.no_learn else None
+        recognition_cache = RecognitionCache() if not args.no_cache else None
 
         result = asyncio.run(
             process_single_file(
@@ -708,6 +980,10 @@ def cmd_process(args: argparse.Namespace) -> None:
                 delay_seconds=args.delay,
                 resume=True,
                 corrections_db=corrections_db,
+                concurrency=args.concurrency,
+                recognition_cache=recognition_cache,
+                silence_db=args.silence_db,
+                burst=args.burst,
             )
         )
 
@@ -758,6 +1034,10 @@ def cmd_identify(args: argparse.Namespace) -> None:
             resume=not args.no_resume,
             open_editor=args.edit,
             use_corrections=not args.no_learn,
+            concurrency=args.concurrency,
+            use_cache=not args.no_cache,
+            silence_db=args.silence_db,
+            burst=args.burst,
         )
     )
 
@@ -857,6 +1137,12 @@ def cmd_chapters(args: argparse.Namespace) -> None:
         print(f"\n{'─' * 60}")
         print("Fetching artwork...")
 
+        # Fetch cover art for all tracks concurrently
+        artwork_by_index = fetch_artwork_batch(chapter_tracks)
+
+        # Tracks that repeat in a set render to identical images; build each once
+        rendered: dict[tuple[str, str, str], bytes] = {}
+
         for i, track in enumerate(chapter_tracks):
             if track.is_unidentified:
                 print(f"  [{i + 1}/{len(chapter_tracks)}] {track.time_str} - Skipping unidentified")
@@ -865,12 +1151,7 @@ def cmd_chapters(args: argparse.Namespace) -> None:
             label = f"{track.artist} - {track.title}"
             print(f"  [{i + 1}/{len(chapter_tracks)}] {track.time_str} - {label}")
 
-            # Fetch cover art
-            artwork_bytes = fetch_artwork(
-                artist=track.artist,
-                title=track.title,
-                coverart_url=track.coverart_url,
-            )
+            artwork_bytes = artwork_by_index.get(i)
 
             if artwork_bytes:
                 print("    Found artwork, generating chapter image...")
@@ -878,12 +1159,15 @@ def cmd_chapters(args: argparse.Namespace) -> None:
                 print("    No artwork found, using text-only image")
 
             # Create MTV-style overlay image
-            chapter_img = create_chapter_image(
-                artwork_bytes=artwork_bytes,
-                artist=track.artist,
-                title=track.title,
-            )
-            chapter_images[i] = chapter_img
+            artwork_hash = hashlib.sha1(artwork_bytes).hexdigest() if artwork_bytes else ""
+            render_key = (track.artist, track.title, artwork_hash)
+            if render_key not in rendered:
+                rendered[render_key] = create_chapter_image(
+                    artwork_bytes=artwork_bytes,
+                    artist=track.artist,
+                    title=track.title,
+                )
+            chapter_images[i] = rendered[render_key]
 
             # Use first track's artwork as episode cover
             if episode_image is None and artwork_bytes:
@@ -917,6 +1201,17 @@ def cmd_chapters(args: argparse.Namespace) -> None:
     print(f"{'=' * 60}")
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate tracklists from DJ sets or long audio recordings using Shazam.",
@@ -1019,7 +1314,23 @@ Examples:
         "--delay",
         type=int,
         default=DEFAULT_DELAY_SECONDS,
-        help=f"Delay between Shazam API calls (default: {DEFAULT_DELAY_SECONDS})",
+        help=f"Seconds between the starts of Shazam API calls; this sets the overall "
+        f"request rate (default: {DEFAULT_DELAY_SECONDS})",
+    )
+
+    process_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent Shazam requests; overlaps slow responses but does not "
+        f"raise the rate set by --delay (default: {DEFAULT_CONCURRENCY})",
+    )
+
+    process_parser.add_argument(
+        "--burst",
+        type=_positive_int,
+        default=DEFAULT_BURST,
+        help=f"Requests allowed back to back before the delay applies (default: {DEFAULT_BURST})",
     )
 
     process_parser.add_argument(
@@ -1028,6 +1339,19 @@ Examples:
         help="Disable learning from corrections",
     )
 
+    process_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the Shazam result cache (query every sample again)",
+    )
+
+    process_parser.add_argument(
+        "--silence-db",
+        type=float,
+        default=DEFAULT_SILENCE_DB,
+        help=f"Skip samples quieter than this RMS level in dBFS (default: {DEFAULT_SILENCE_DB:g})",
+    )
+
     process_parser.add_argument(
         "--verbose",
         action="store_true",
@@ -1067,7 +1391,23 @@ Examples:
         "--delay",
         type=int,
         default=DEFAULT_DELAY_SECONDS,
-        help=f"Delay in seconds between API calls (default: {DEFAULT_DELAY_SECONDS})",
+        help=f"Seconds between the starts of Shazam API calls; this sets the overall "
+        f"request rate (default: {DEFAULT_DELAY_SECONDS})",
+    )
+
+    identify_parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Maximum concurrent Shazam requests; overlaps slow responses but does not "
+        f"raise the rate set by --delay (default: {DEFAULT_CONCURRENCY})",
+    )
+
+    identify_parser.add_argument(
+        "--burst",
+        type=_positive_int,
+        default=DEFAULT_BURST,
+        help=f"Requests allowed back to back before the delay applies (default: {DEFAULT_BURST})",
     )
 
     identify_parser.add_argument(
@@ -1089,6 +1429,19 @@ Examples:
         help="Disable learning from corrections",
     )
 
+    identify_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the Shazam result cache (query every sample again)",
+    )
+
+    identify_parser.add_argument(
+        "--silence-db",
+        type=float,
+        default=DEFAULT_SILENCE_DB,
+        help=f"Skip samples quieter than this RMS level in dBFS (default: {DEFAULT_SILENCE_DB:g})",
+    )
+
     # ─────────────────────────────────────────────────────────────────────────
     # 'chapters' subcommand - embed chapter markers and artwork
     # ─────────────────────────────────────────────────────────────────────────
@@ -8,20 +8,44 @@ Provides a spreadsheet-like interface for:
 - Saving corrections that improve future identifications
 """
 
+import asyncio
 import json
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
-from textual import on
+from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Static
 
-from setlist_maker import AUDIO_EXTENSIONS
+from setlist_maker import AUDIO_EXTENSIONS, write_atomic
+
+try:
+    import orjson  # Optional C-accelerated serializer for the save path
+except ImportError:
+    orjson = None
+
+# Tracks: "1. **Artist** - Title (MM:SS)" or "1. *Unidentified* (MM:SS)"
+_TRACK_RE = re.compile(
+    r"^\d+\.\s+"
+    r"(?:"
+    r"\*\*(.+?)\*\*\s*-\s*(.+?)"  # **Artist** - Title
+    r"|"
+    r"\*Unidentified\*"  # *Unidentified*
+    r")\s*"
+    r"\((\d+:\d+(?::\d+)?)\)"  # (MM:SS) or (H:MM:SS)
+)
+_DATE_RE = re.compile(r"\*Generated on (.+)\*")
+
+# Seconds to wait before redrawing the status label after a change
+STATUS_UPDATE_DELAY = 0.05
 
 
 @dataclass
@@ -38,7 +62,7 @@ class Track:
     original_artist: str | None = None  # For tracking corrections
     original_title: str | None = None
 
-    @property
+    @cached_property
     def time_str(self) -> str:
         """Format timestamp as HH:MM:SS or MM:SS."""
         hours = self.timestamp // 3600
@@ -110,58 +134,59 @@ class Tracklist:
         ]
 
 
+def _json_bytes(data) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
 def parse_markdown_tracklist(content: str) -> Tracklist:
     """Parse a markdown tracklist file into a Tracklist object."""
-    lines = content.strip().split("\n")
     tracklist = Tracklist(source_file="")
+    found_header = False
+    found_date = False
 
-    # Parse header: # Tracklist: filename.mp3
-    for line in lines:
+    for line in content.strip().split("\n"):
+        # Header: # Tracklist: filename.mp3
         if line.startswith("# Tracklist:"):
-            tracklist.source_file = line.replace("# Tracklist:", "").strip()
-            break
+            if not found_header:
+                tracklist.source_file = line[len("# Tracklist:") :].strip()
+                found_header = True
+            continue
 
-    # Parse generation date: *Generated on YYYY-MM-DD HH:MM*
-    for line in lines:
+        # Generation date: *Generated on YYYY-MM-DD HH:MM*
         if line.startswith("*Generated on"):
-            match = re.search(r"\*Generated on (.+)\*", line)
-            if match:
-                tracklist.generated_on = match.group(1)
-            break
-
-    # Parse tracks: "1. **Artist** - Title (MM:SS)" or "1. *Unidentified* (MM:SS)"
-    track_pattern = re.compile(
-        r"^\d+\.\s+"
-        r"(?:"
-        r"\*\*(.+?)\*\*\s*-\s*(.+?)"  # **Artist** - Title
-        r"|"
-        r"\*Unidentified\*"  # *Unidentified*
-        r")\s*"
-        r"\((\d+:\d+(?::\d+)?)\)"  # (MM:SS) or (H:MM:SS)
-    )
-
-    for line in lines:
-        match = track_pattern.match(line.strip())
-        if match:
-            artist = match.group(1) or ""
-            title = match.group(2) or ""
-            time_str = match.group(3)
-
-            # Parse timestamp
-            parts = time_str.split(":")
-            if len(parts) == 3:
-                timestamp = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-            else:
-                timestamp = int(parts[0]) * 60 + int(parts[1])
-
-            track = Track(
-                timestamp=timestamp,
-                artist=artist.strip(),
-                title=title.strip(),
-                original_artist=artist.strip() if artist else None,
-                original_title=title.strip() if title else None,
-            )
-            tracklist.tracks.append(track)
+            if not found_date:
+                match = _DATE_RE.search(line)
+                if match:
+                    tracklist.generated_on = match.group(1)
+                found_date = True
+            continue
+
+        match = _TRACK_RE.match(line.strip())
+        if not match:
+            continue
+
+        artist = match.group(1) or ""
+        title = match.group(2) or ""
+        time_str = match.group(3)
+
+        # Parse timestamp
+        parts = time_str.split(":")
+        if len(parts) == 3:
+            timestamp = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+        else:
+            timestamp = int(parts[0]) * 60 + int(parts[1])
+
+        track = Track(
+            timestamp=timestamp,
+            artist=artist.strip(),
+            title=title.strip(),
+            original_artist=artist.strip() if artist else None,
+            original_title=title.strip() if title else None,
+        )
+        tracklist.tracks.append(track)
 
     return tracklist
 
@@ -349,6 +374,13 @@ class TracklistEditor(App[None]):
         self.output_path = output_path
         self.corrections_db = corrections_db
         self.unsaved_changes = False
+        # Kept up to date by the actions that change them, so the status bar
+        # doesn't rescan the tracklist on every keypress
+        self._rejected_count = sum(1 for t in tracklist.tracks if t.rejected)
+        self._edited_count = sum(1 for t in tracklist.tracks if t.was_corrected)
+        self._save_lock = threading.Lock()
+        self._save_generation = 0
+        self._status_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -369,59 +401,71 @@ class TracklistEditor(App[None]):
         table.cursor_type = "row"
         table.zebra_stripes = True
 
-        # Add columns
-        table.add_column("#", width=4)
-        table.add_column("Time", width=10)
-        table.add_column("Artist", width=30)
-        table.add_column("Title", width=40)
-        table.add_column("Status", width=12)
+        # Add columns (keys are kept so single cells can be updated later)
+        self._column_keys = [
+            table.add_column("#", width=4),
+            table.add_column("Time", width=10),
+            table.add_column("Artist", width=30),
+            table.add_column("Title", width=40),
+            table.add_column("Status", width=12),
+        ]
 
         # Populate rows
         self._refresh_table()
 
+    def _row_cells(self, idx: int, track: Track) -> tuple[str, str, str, str, str]:
+        """Build the display cells for one track row."""
+        status = ""
+        if track.rejected:
+            status = "[red]REJECTED[/]"
+        elif track.was_corrected:
+            status = "[green]EDITED[/]"
+        elif track.is_unidentified:
+            status = "[yellow]UNKNOWN[/]"
+
+        artist_display = track.artist if track.artist else "[dim italic]Unknown[/]"
+        title_display = track.title if track.title else "[dim italic]Unknown[/]"
+
+        if track.rejected:
+            artist_display = f"[strike dim]{track.artist}[/]"
+            title_display = f"[strike dim]{track.title}[/]"
+
+        return str(idx + 1), track.time_str, artist_display, title_display, status
+
     def _refresh_table(self) -> None:
         """Refresh the table contents from the tracklist."""
         table = self.query_one("#track-table", DataTable)
         table.clear()
 
         for i, track in enumerate(self.tracklist.tracks):
-            status = ""
-            if track.rejected:
-                status = "[red]REJECTED[/]"
-            elif track.was_corrected:
-                status = "[green]EDITED[/]"
-            elif track.is_unidentified:
-                status = "[yellow]UNKNOWN[/]"
+            table.add_row(*self._row_cells(i, track), key=str(i))
 
-            artist_display = track.artist if track.artist else "[dim italic]Unknown[/]"
-            title_display = track.title if track.title else "[dim italic]Unknown[/]"
+        self._update_status()
 
-            if track.rejected:
-                artist_display = f"[strike dim]{track.artist}[/]"
-                title_display = f"[strike dim]{track.title}[/]"
-
-            table.add_row(
-                str(i + 1),
-                track.time_str,
-                artist_display,
-                title_display,
-                status,
-                key=str(i),
-            )
+    def _refresh_row(self, idx: int) -> None:
+        """Redraw a single track's row after it changed, leaving the rest alone."""
+        table = self.query_one("#track-table", DataTable)
+        cells = self._row_cells(idx, self.tracklist.tracks[idx])
+        for column_key, value in zip(self._column_keys, cells):
+            table.update_cell(str(idx), column_key, value)
 
         self._update_status()
 
     def _update_status(self) -> None:
+        """Schedule a status label update, coalescing bursts of changes into one."""
+        if self._status_timer is None:
+            self._status_timer = self.set_timer(STATUS_UPDATE_DELAY, self._flush_status)
+
+    def _flush_status(self) -> None:
         """Update the status label."""
+        self._status_timer = None
         status = self.query_one("#status-label", Label)
-        rejected_count = sum(1 for t in self.tracklist.tracks if t.rejected)
-        edited_count = sum(1 for t in self.tracklist.tracks if t.was_corrected)
 
         parts = []
-        if rejected_count:
-            parts.append(f"Rejected: {rejected_count}")
-        if edited_count:
-            parts.append(f"Edited: {edited_count}")
+        if self._rejected_count:
+            parts.append(f"Rejected: {self._rejected_count}")
+        if self._edited_count:
+            parts.append(f"Edited: {self._edited_count}")
         if self.unsaved_changes:
             parts.append("[bold red]UNSAVED[/]")
 
@@ -440,11 +484,9 @@ class TracklistEditor(App[None]):
         if result:
             idx, track = result
             track.rejected = not track.rejected
+            self._rejected_count += 1 if track.rejected else -1
             self.unsaved_changes = True
-            self._refresh_table()
-            # Keep cursor on same row
-            table = self.query_one("#track-table", DataTable)
-            table.move_cursor(row=idx)
+            self._refresh_row(idx)
 
     def action_edit_track(self) -> None:
         """Open edit dialog for current track."""
@@ -461,6 +503,7 @@ class TracklistEditor(App[None]):
         if result is not None:
             artist, title = result
             track = self.tracklist.tracks[idx]
+            was_corrected = track.was_corrected
 
             # Store original values for correction learning
             if track.original_artist is None:
@@ -470,6 +513,7 @@ class TracklistEditor(App[None]):
 
             track.artist = artist
             track.title = title
+            self._edited_count += track.was_corrected - was_corrected
             self.unsaved_changes = True
 
             # Record correction for learning
@@ -481,32 +525,55 @@ class TracklistEditor(App[None]):
                     corrected_title=title,
                 )
 
-            self._refresh_table()
-            table = self.query_one("#track-table", DataTable)
-            table.move_cursor(row=idx)
+            self._refresh_row(idx)
 
     def action_save(self) -> None:
         """Save the tracklist to file."""
-        # Save markdown
-        markdown = self.tracklist.to_markdown()
-        with open(self.output_path, "w") as f:
-            f.write(markdown)
-
-        # Also save JSON version
-        json_path = self.output_path.with_suffix(".json")
-        with open(json_path, "w") as f:
-            json.dump(self.tracklist.to_json(), f, indent=2)
-
-        # Save corrections database
+        # Serialize now so edits made while the files are written can't race them
+        files = [
+            (self.output_path, self.tracklist.to_markdown().encode()),
+            (self.output_path.with_suffix(".json"), _json_bytes(self.tracklist.to_json())),
+        ]
         if self.corrections_db:
-            self.corrections_db.save()
+            files.append((self.corrections_db.db_path, self.corrections_db.serialize()))
 
         self.unsaved_changes = False
         self._update_status()
-        self.notify(f"Saved to {self.output_path}", title="Saved")
-
-    def action_quit(self) -> None:
+        self._save_generation += 1
+        self._write_files(files, self._save_generation)
+
+    @work(group="save")
+    async def _write_files(self, files: list[tuple[Path, bytes]], generation: int) -> None:
+        """Write saved files off the UI thread so slow disks don't stall the editor."""
+
+        def write_all() -> bool:
+            with self._save_lock:
+                # The lock isn't FIFO: skip a save that a newer one has superseded
+                # rather than let it overwrite the newer files
+                if generation != self._save_generation:
+                    return False
+                for path, data in files:
+                    write_atomic(path, data)
+                return True
+
+        try:
+            written = await asyncio.to_thread(write_all)
+        except OSError as e:
+            # A newer save, if any, writes everything this one would have
+            if generation == self._save_generation:
+                self.unsaved_changes = True
+                self._update_status()
+            self.notify(str(e), title="Save Failed", severity="error")
+            return
+
+        if written:
+            self.notify(f"Saved to {self.output_path}", title="Saved")
+
+    async def action_quit(self) -> None:
         """Quit the editor."""
+        # Finish any save in progress first, so a failed write is reported
+        await self.workers.wait_for_complete([w for w in self.workers if w.group == "save"])
+
         if self.unsaved_changes:
             self.notify(
                 "You have unsaved changes! Press S to save or Q again to quit.",
@@ -569,10 +636,13 @@ class CorrectionsDB:
             except (json.JSONDecodeError, IOError):
                 self.corrections = {}
 
+    def serialize(self) -> bytes:
+        """Serialize the corrections database as JSON."""
+        return _json_bytes({"corrections": self.corrections})
+
     def save(self) -> None:
         """Save corrections to disk."""
-        with open(self.db_path, "w") as f:
-            json.dump({"corrections": self.corrections}, f, indent=2)
+        write_atomic(self.db_path, self.serialize())
 
     def add_correction(
         self,
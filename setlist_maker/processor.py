@@ -22,6 +22,8 @@ import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
+
 
 @dataclass
 class ProcessingConfig:
@@ -343,26 +345,25 @@ def _downsample_to_sparkline(db_values: list[float], num_points: int) -> list[fl
     if not db_values:
         return []
 
-    # Split into buckets and average
-    bucket_size = max(1, len(db_values) // num_points)
-    buckets = []
-    for i in range(0, len(db_values), bucket_size):
-        chunk = db_values[i : i + bucket_size]
-        buckets.append(sum(chunk) / len(chunk))
-
-    # Trim to desired number of points
-    buckets = buckets[:num_points]
+    # Split into buckets (keeping at most num_points) and average each one.
+    # A long recording yields hundreds of thousands of values, so this is
+    # done with NumPy reductions rather than per-bucket Python slices.
+    values = np.asarray(db_values, dtype=np.float64)
+    bucket_size = max(1, len(values) // num_points)
+    starts = np.arange(0, len(values), bucket_size)[:num_points]
+    counts = np.minimum(bucket_size, len(values) - starts)
+    values = values[: starts[-1] + counts[-1]]
+    buckets = np.add.reduceat(values, starts) / counts
 
     # Normalize to 0.0-1.0 range
-    min_val = min(buckets)
-    max_val = max(buckets)
-    val_range = max_val - min_val
+    min_val = buckets.min()
+    val_range = buckets.max() - min_val
 
     if val_range < 0.01:
         # All values roughly the same — flat line at mid-height
         return [0.5] * len(buckets)
 
-    return [(v - min_val) / val_range for v in buckets]
+    return ((buckets - min_val) / val_range).tolist()
 
 
 def get_audio_duration(audio_file: Path) -> float | None:
@@ -396,3 +397,74 @@ def get_audio_duration(audio_file: Path) -> float | None:
         return None
     except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
         return None
+
+
+def decode_audio(audio_file: Path, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Decode an audio file to mono 16-bit PCM samples using FFmpeg.
+
+    FFmpeg downmixes and resamples during decoding. Its output is read
+    straight into a NumPy buffer presized from the probed duration, so the
+    decoded audio is held in memory once rather than also as one large bytes
+    object, and slicing the result is zero-copy.
+
+    Args:
+        audio_file: Path to the audio file.
+        sample_rate: Output sample rate in Hz.
+
+    Returns:
+        1-D int16 array of samples.
+
+    Raises:
+        FFmpegError: If FFmpeg is not available or decoding fails.
+    """
+    duration = get_audio_duration(audio_file)
+    # One second of slack covers rounding in the probed duration
+    samples = np.empty(int((duration or 0) * sample_rate) + sample_rate, dtype="<i2")
+    filled = 0  # bytes
+
+    # stderr goes to a file so a flood of decode warnings can never fill the
+    # pipe and stall FFmpeg while we are reading stdout
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            proc = subprocess.Popen(
+                [
+                    "ffmpeg",
+                    "-v",
+                    "error",
+                    "-i",
+                    str(audio_file),
+                    "-f",
+                    "s16le",
+                    "-acodec",
+                    "pcm_s16le",
+                    "-ac",
+                    "1",
+                    "-ar",
+                    str(sample_rate),
+                    "-",
+                ],
+                stdout=subprocess.PIPE,
+                stderr=stderr,
+            )
+        except FileNotFoundError as e:
+            raise FFmpegError("FFmpeg not found") from e
+
+        with proc:
+            while True:
+                if filled == samples.nbytes:
+                    # Duration was unknown or underestimated
+                    grown = np.empty(2 * len(samples), dtype="<i2")
+                    grown[: len(samples)] = samples
+                    samples = grown
+                read = proc.stdout.readinto(memoryview(samples).cast("B")[filled:])
+                if not read:
+                    break
+                filled += read
+
+        if proc.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace")
+            raise FFmpegError(f"FFmpeg decoding failed:\n{message}")
+
+    return samples[: filled // 2]
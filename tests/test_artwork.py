@@ -1,19 +1,33 @@
 """Tests for setlist_maker.artwork module."""
 
+import http.server
 import io
+import threading
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import urllib3
 from PIL import Image, ImageDraw, ImageFont
 
+from setlist_maker import artwork
 from setlist_maker.artwork import (
     CHAPTER_IMAGE_SIZE,
+    JPEG_INITIAL_QUALITY,
     MAX_IMAGE_BYTES,
+    MUSICBRAINZ_REQUEST_INTERVAL,
     _clean_query,
     _compress_to_jpeg,
     _create_fallback_background,
     _draw_text_fitted,
+    _encode_jpeg,
+    _find_font,
+    _itunes_lookup,
+    _resolve_font_path,
+    _wait_for_musicbrainz,
     create_chapter_image,
+    download_image,
     fetch_artwork,
+    fetch_artwork_batch,
     resize_cover_art_url,
     search_deezer_artwork,
     search_itunes_artwork,
@@ -42,6 +56,11 @@ class TestResizeCoverArtUrl:
         result = resize_cover_art_url(url, 1200)
         assert "1200x1200bb" in result
 
+    def test_resizes_uncommon_dimensions(self):
+        url = "https://is1-ssl.mzstatic.com/image/thumb/Music/v4/ab/1000x1000bb.jpg"
+        result = resize_cover_art_url(url, 600)
+        assert result == "https://is1-ssl.mzstatic.com/image/thumb/Music/v4/ab/600x600bb.jpg"
+
     def test_handles_url_without_dimensions(self):
         url = "https://example.com/image.jpg"
         result = resize_cover_art_url(url, 600)
@@ -56,40 +75,104 @@ class TestResizeCoverArtUrl:
         assert "600x600bb" in result
 
 
+class TestDownloadImage:
+    """Tests for download_image."""
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_response_bytes(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(status=200, data=b"image-data")
+
+        result = download_image("https://example.com/art.jpg")
+
+        assert result == b"image-data"
+        mock_pool.request.assert_called_once_with("GET", "https://example.com/art.jpg", timeout=15)
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_http_error_status(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(status=404, data=b"not found")
+
+        assert download_image("https://example.com/missing.jpg") is None
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_network_error(self, mock_pool):
+        mock_pool.request.side_effect = Exception("Network error")
+
+        assert download_image("https://example.com/art.jpg") is None
+
+
 class TestSearchItunesArtwork:
     """Tests for search_itunes_artwork."""
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_resized_url(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"resultCount": 1, "results": [{"artworkUrl100": "https://example.com/art/100x100bb.jpg"}]}'
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+    def setup_method(self):
+        _itunes_lookup.cache_clear()
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_resized_url(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(
+            status=200,
+            data=b'{"resultCount": 1, "results": [{"artworkUrl100": "https://example.com/art/100x100bb.jpg"}]}',
+        )
 
         result = search_itunes_artwork("Daft Punk", "Around the World", 600)
 
         assert result is not None
         assert "600x600bb" in result
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_no_results(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"resultCount": 0, "results": []}'
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_no_results(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(
+            status=200, data=b'{"resultCount": 0, "results": []}'
+        )
 
         result = search_itunes_artwork("Unknown", "Track")
         assert result is None
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_network_error(self, mock_urlopen):
-        mock_urlopen.side_effect = Exception("Network error")
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_network_error(self, mock_pool):
+        mock_pool.request.side_effect = Exception("Network error")
 
         result = search_itunes_artwork("Artist", "Title")
         assert result is None
 
+    @patch("setlist_maker.artwork._POOL")
+    def test_caches_repeated_lookups(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(
+            status=200,
+            data=b'{"resultCount": 1, "results": [{"artworkUrl100": "https://example.com/art/100x100bb.jpg"}]}',
+        )
+
+        first = search_itunes_artwork("Daft Punk", "Around the World")
+        second = search_itunes_artwork(" daft punk ", "AROUND THE WORLD")
+
+        assert first == second
+        mock_pool.request.assert_called_once()
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_does_not_cache_http_errors(self, mock_pool):
+        mock_pool.request.side_effect = [
+            MagicMock(status=429, data=b'{"resultCount": 0, "results": []}'),
+            MagicMock(
+                status=200,
+                data=b'{"resultCount": 1, "results": [{"artworkUrl100": "https://example.com/art/100x100bb.jpg"}]}',
+            ),
+        ]
+
+        assert search_itunes_artwork("Artist", "Title") is None
+        assert search_itunes_artwork("Artist", "Title") is not None
+        assert mock_pool.request.call_count == 2
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_does_not_cache_failures(self, mock_pool):
+        mock_pool.request.side_effect = [
+            Exception("Network error"),
+            MagicMock(status=200, data=b'{"resultCount": 0, "results": []}'),
+        ]
+
+        search_itunes_artwork("Artist", "Title")
+        search_itunes_artwork("Artist", "Title")
+
+        assert mock_pool.request.call_count == 2
+
 
 class TestCreateChapterImage:
     """Tests for create_chapter_image."""
@@ -117,6 +200,44 @@ class TestCreateChapterImage:
         assert img.format == "JPEG"
         assert img.size == (CHAPTER_IMAGE_SIZE, CHAPTER_IMAGE_SIZE)
 
+    def test_downscales_large_jpeg_artwork(self):
+        artwork = _make_test_image(size=3000)
+        result = create_chapter_image(artwork, "Artist", "Title")
+
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (CHAPTER_IMAGE_SIZE, CHAPTER_IMAGE_SIZE)
+
+    def test_handles_png_artwork(self):
+        buf = io.BytesIO()
+        Image.new("RGBA", (800, 800), (0, 128, 255, 255)).save(buf, format="PNG")
+        result = create_chapter_image(buf.getvalue(), "Artist", "Title")
+
+        img = Image.open(io.BytesIO(result))
+        assert img.size == (CHAPTER_IMAGE_SIZE, CHAPTER_IMAGE_SIZE)
+
+    def test_crops_non_square_artwork_instead_of_stretching(self):
+        # Wide image: blue side bands around a red square center
+        img = Image.new("RGB", (1200, 600), (0, 0, 255))
+        img.paste((255, 0, 0), (300, 0, 900, 600))
+        buf = io.BytesIO()
+        img.save(buf, format="PNG")
+
+        result = create_chapter_image(buf.getvalue(), "", "")
+
+        loaded = Image.open(io.BytesIO(result)).convert("RGB")
+        r, g, b = loaded.getpixel((5, 100))
+        assert r > 200 and b < 60
+
+    def test_darkens_lower_third_only(self):
+        artwork = _make_test_image(color=(200, 200, 200))
+        result = create_chapter_image(artwork, "", "")
+
+        img = Image.open(io.BytesIO(result)).convert("RGB")
+        top = img.getpixel((300, 100))
+        bottom = img.getpixel((300, CHAPTER_IMAGE_SIZE - 5))
+        assert all(c > 180 for c in top)
+        assert all(c < 100 for c in bottom)
+
     def test_creates_image_with_custom_size(self):
         result = create_chapter_image(None, "Artist", "Title", size=300)
 
@@ -154,6 +275,12 @@ class TestCreateFallbackBackground:
         img = _create_fallback_background(100)
         assert img.mode == "RGBA"
 
+    def test_vertical_gradient_darkens_to_blue(self):
+        img = _create_fallback_background(100)
+        assert img.getpixel((0, 0)) == (30, 30, 40, 255)
+        assert img.getpixel((99, 0)) == (30, 30, 40, 255)
+        assert img.getpixel((0, 99)) == (44, 39, 59, 255)
+
 
 class TestCompressToJpeg:
     """Tests for _compress_to_jpeg."""
@@ -170,6 +297,44 @@ class TestCompressToJpeg:
         loaded = Image.open(io.BytesIO(result))
         assert loaded.format == "JPEG"
 
+    def test_emits_progressive_jpeg(self):
+        img = Image.new("RGB", (600, 600), (0, 0, 0))
+        result = _compress_to_jpeg(img)
+
+        loaded = Image.open(io.BytesIO(result))
+        assert loaded.info.get("progressive")
+
+    def test_noisy_image_stays_under_max_bytes(self):
+        rng = np.random.default_rng(0)
+        img = Image.fromarray(rng.integers(0, 256, (600, 600, 3), dtype=np.uint8), "RGB")
+        result = _compress_to_jpeg(img, max_bytes=100_000)
+        assert len(result) <= 100_000
+
+    def test_downscales_high_detail_image_before_compressing(self):
+        rng = np.random.default_rng(0)
+        img = Image.fromarray(rng.integers(0, 256, (600, 600, 3), dtype=np.uint8), "RGB")
+        result = _compress_to_jpeg(img, max_bytes=50_000)
+
+        loaded = Image.open(io.BytesIO(result))
+        assert loaded.size[0] < 600
+        assert len(result) <= 50_000
+
+    def test_keeps_size_for_low_detail_image(self):
+        img = Image.new("RGB", (600, 600), (128, 64, 200))
+        result = _compress_to_jpeg(img)
+
+        assert Image.open(io.BytesIO(result)).size == (600, 600)
+
+    def test_image_that_fits_needs_a_single_encode(self):
+        img = Image.new("RGB", (600, 600), (128, 64, 200))
+        with patch("setlist_maker.artwork._encode_jpeg", wraps=_encode_jpeg) as mock_encode:
+            _compress_to_jpeg(img)
+        # Fits at the initial quality, so no probe or search is needed
+        assert mock_encode.call_count == 1
+        args, kwargs = mock_encode.call_args
+        assert args == (img, JPEG_INITIAL_QUALITY)
+        assert kwargs["optimize"] is True
+
 
 class TestDrawTextFitted:
     """Tests for _draw_text_fitted."""
@@ -189,6 +354,48 @@ class TestDrawTextFitted:
         _draw_text_fitted(draw, 10, 10, "A" * 500, font, 100, (255, 255, 255))
         # Should not raise
 
+    def test_truncates_to_longest_fitting_prefix(self):
+        img = Image.new("RGBA", (300, 100), (0, 0, 0, 0))
+        draw = MagicMock(wraps=ImageDraw.Draw(img))
+        font = ImageFont.load_default(size=16)
+        text = "The Quick Brown Fox Jumps Over The Lazy Dog"
+
+        _draw_text_fitted(draw, 10, 10, text, font, 150, (255, 255, 255))
+
+        drawn = draw.text.call_args[0][1]
+        assert drawn.endswith("...")
+        prefix = drawn[:-3]
+
+        def width(s):
+            bbox = ImageDraw.Draw(img).textbbox((0, 0), s, font=font)
+            return bbox[2] - bbox[0]
+
+        assert width(drawn) <= 150
+        assert width(text[: len(prefix) + 1] + "...") > 150
+
+
+class TestFindFont:
+    """Tests for _find_font."""
+
+    def test_returns_same_font_object_for_same_size(self):
+        assert _find_font(24) is _find_font(24)
+
+    def test_returns_distinct_fonts_for_different_sizes(self):
+        assert _find_font(24) is not _find_font(25)
+
+    def test_resolves_font_path_once(self):
+        _find_font(31)
+        _find_font(32)
+        assert _resolve_font_path.cache_info().currsize == 1
+
+    @patch("setlist_maker.artwork._resolve_font_path", return_value=None)
+    def test_falls_back_to_default_font(self, _mock_resolve):
+        _find_font.cache_clear()
+        try:
+            assert _find_font(20) is not None
+        finally:
+            _find_font.cache_clear()
+
 
 class TestCleanQuery:
     """Tests for _clean_query."""
@@ -221,52 +428,49 @@ class TestCleanQuery:
 class TestSearchDeezerArtwork:
     """Tests for search_deezer_artwork."""
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_artwork_url(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = (
-            b'{"data": [{"album": {"cover_xl": '
-            b'"https://e-cdns-images.dzcdn.net/images/cover/abc/1000x1000-000000-80-0-0.jpg"}}]}'
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_artwork_url(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(
+            status=200,
+            data=b'{"data": [{"album": {"cover_xl": '
+            b'"https://e-cdns-images.dzcdn.net/images/cover/abc/1000x1000-000000-80-0-0.jpg"}}]}',
         )
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
 
         result = search_deezer_artwork("Daft Punk", "One More Time", 600)
 
         assert result is not None
         assert "600x600" in result
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_falls_back_to_cover_big(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = (
-            b'{"data": [{"album": {"cover_big": '
-            b'"https://e-cdns-images.dzcdn.net/images/cover/abc/500x500-000000-80-0-0.jpg"}}]}'
+    @patch("setlist_maker.artwork._POOL")
+    def test_falls_back_to_cover_big(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(
+            status=200,
+            data=b'{"data": [{"album": {"cover_big": '
+            b'"https://e-cdns-images.dzcdn.net/images/cover/abc/500x500-000000-80-0-0.jpg"}}]}',
         )
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
 
         result = search_deezer_artwork("Artist", "Title", 600)
 
         assert result is not None
         assert "600x600" in result
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_empty_results(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"data": []}'
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_empty_results(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(status=200, data=b'{"data": []}')
 
         result = search_deezer_artwork("Unknown", "Track")
         assert result is None
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_network_error(self, mock_urlopen):
-        mock_urlopen.side_effect = Exception("Network error")
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_http_error_status(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(status=503, data=b"")
+
+        result = search_deezer_artwork("Artist", "Title")
+        assert result is None
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_network_error(self, mock_pool):
+        mock_pool.request.side_effect = Exception("Network error")
 
         result = search_deezer_artwork("Artist", "Title")
         assert result is None
@@ -275,70 +479,144 @@ class TestSearchDeezerArtwork:
 class TestSearchMusicbrainzArtwork:
     """Tests for search_musicbrainz_artwork."""
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_cover_art_url(self, mock_urlopen):
+    def setup_method(self):
+        artwork._musicbrainz_next_request = 0.0
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_cover_art_url(self, mock_pool):
         # First call: MusicBrainz recording search
-        mb_response = MagicMock()
-        mb_response.read.return_value = b'{"recordings": [{"releases": [{"id": "abc-123"}]}]}'
-        mb_response.__enter__ = lambda s: s
-        mb_response.__exit__ = MagicMock(return_value=False)
+        mb_response = MagicMock(
+            status=200, data=b'{"recordings": [{"releases": [{"id": "abc-123"}]}]}'
+        )
 
-        # Second call: Cover Art Archive redirect
-        caa_response = MagicMock()
-        caa_response.url = "https://archive.org/download/mbid-abc-123/front-500.jpg"
-        caa_response.__enter__ = lambda s: s
-        caa_response.__exit__ = MagicMock(return_value=False)
+        # Second call: Cover Art Archive, followed through its redirect
+        caa_response = MagicMock(status=200)
+        caa_response.geturl.return_value = "https://archive.org/download/mbid-abc-123/front-500.jpg"
 
-        mock_urlopen.side_effect = [mb_response, caa_response]
+        mock_pool.request.side_effect = [mb_response, caa_response]
 
         result = search_musicbrainz_artwork("Daft Punk", "One More Time")
 
         assert result == "https://archive.org/download/mbid-abc-123/front-500.jpg"
-        assert mock_urlopen.call_count == 2
+        assert mock_pool.request.call_count == 2
+        caa_response.close.assert_called_once()
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_follows_long_cover_art_redirect_chain(self, mock_pool):
+        # Three hops, like coverartarchive.org -> archive.org -> ia*.us.archive.org
+        class Handler(http.server.BaseHTTPRequestHandler):
+            hops = {"/front-500": "/download", "/download": "/node", "/node": "/front.jpg"}
+
+            def do_GET(self):
+                if self.path in self.hops:
+                    self.send_response(307)
+                    self.send_header("Location", base + self.hops[self.path])
+                    self.send_header("Content-Length", "0")
+                else:
+                    self.send_response(200)
+                    self.send_header("Content-Length", "3")
+                self.end_headers()
+                if self.path not in self.hops:
+                    self.wfile.write(b"jpg")
+
+            def log_message(self, *args):
+                pass
+
+        server = http.server.HTTPServer(("127.0.0.1", 0), Handler)
+        base = f"http://127.0.0.1:{server.server_port}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        real_pool = urllib3.PoolManager()
+
+        def caa_request(method, url, **kwargs):
+            # Send the Cover Art Archive request, with its real retry settings, to the local chain
+            return real_pool.request(method, base + "/front-500", **kwargs)
+
+        mb_response = MagicMock(
+            status=200, data=b'{"recordings": [{"releases": [{"id": "abc-123"}]}]}'
+        )
+        mock_pool.request.side_effect = lambda method, url, **kw: (
+            mb_response if "musicbrainz" in url else caa_request(method, url, **kw)
+        )
+
+        try:
+            result = search_musicbrainz_artwork("Daft Punk", "One More Time")
+        finally:
+            server.shutdown()
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_no_recordings(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"recordings": []}'
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        assert result == base + "/front.jpg"
+
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_no_recordings(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(status=200, data=b'{"recordings": []}')
 
         result = search_musicbrainz_artwork("Unknown", "Track")
         assert result is None
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_no_releases(self, mock_urlopen):
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"recordings": [{"releases": []}]}'
-        mock_response.__enter__ = lambda s: s
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_no_releases(self, mock_pool):
+        mock_pool.request.return_value = MagicMock(
+            status=200, data=b'{"recordings": [{"releases": []}]}'
+        )
 
         result = search_musicbrainz_artwork("Artist", "Title")
         assert result is None
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_mb_network_error(self, mock_urlopen):
-        mock_urlopen.side_effect = Exception("Network error")
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_mb_network_error(self, mock_pool):
+        mock_pool.request.side_effect = Exception("Network error")
 
         result = search_musicbrainz_artwork("Artist", "Title")
         assert result is None
 
-    @patch("setlist_maker.artwork.urllib.request.urlopen")
-    def test_returns_none_on_caa_error(self, mock_urlopen):
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_caa_error(self, mock_pool):
         # MusicBrainz succeeds
-        mb_response = MagicMock()
-        mb_response.read.return_value = b'{"recordings": [{"releases": [{"id": "abc-123"}]}]}'
-        mb_response.__enter__ = lambda s: s
-        mb_response.__exit__ = MagicMock(return_value=False)
+        mb_response = MagicMock(
+            status=200, data=b'{"recordings": [{"releases": [{"id": "abc-123"}]}]}'
+        )
 
         # Cover Art Archive fails
-        mock_urlopen.side_effect = [mb_response, Exception("404 Not Found")]
+        mock_pool.request.side_effect = [mb_response, Exception("Connection reset")]
 
         result = search_musicbrainz_artwork("Artist", "Title")
         assert result is None
 
+    @patch("setlist_maker.artwork._POOL")
+    def test_returns_none_on_caa_not_found(self, mock_pool):
+        mb_response = MagicMock(
+            status=200, data=b'{"recordings": [{"releases": [{"id": "abc-123"}]}]}'
+        )
+        mock_pool.request.side_effect = [mb_response, MagicMock(status=404)]
+
+        result = search_musicbrainz_artwork("Artist", "Title")
+        assert result is None
+
+
+class TestWaitForMusicbrainz:
+    """Tests for _wait_for_musicbrainz."""
+
+    def setup_method(self):
+        artwork._musicbrainz_next_request = 0.0
+
+    @patch("setlist_maker.artwork.time.sleep")
+    @patch("setlist_maker.artwork.time.monotonic", return_value=100.0)
+    def test_spaces_back_to_back_searches(self, mock_monotonic, mock_sleep):
+        _wait_for_musicbrainz()
+        mock_sleep.assert_not_called()
+
+        _wait_for_musicbrainz()
+        mock_sleep.assert_called_once_with(MUSICBRAINZ_REQUEST_INTERVAL)
+
+    @patch("setlist_maker.artwork.time.sleep")
+    @patch("setlist_maker.artwork.time.monotonic")
+    def test_no_wait_after_interval(self, mock_monotonic, mock_sleep):
+        mock_monotonic.side_effect = [100.0, 100.0, 102.0, 102.0]
+
+        _wait_for_musicbrainz()
+        _wait_for_musicbrainz()
+
+        mock_sleep.assert_not_called()
+
 
 class TestFetchArtworkWaterfall:
     """Tests for fetch_artwork strategy waterfall."""
@@ -449,3 +727,32 @@ class TestFetchArtworkWaterfall:
         result = fetch_artwork("Artist", "Title")
 
         assert result is None
+
+
+class TestFetchArtworkBatch:
+    """Tests for fetch_artwork_batch."""
+
+    @patch("setlist_maker.artwork.fetch_artwork")
+    def test_maps_results_by_track_index(self, mock_fetch, sample_tracklist):
+        mock_fetch.side_effect = lambda artist, title, url, size: f"{artist}".encode()
+
+        result = fetch_artwork_batch(sample_tracklist.tracks)
+
+        # Unidentified track at index 2 is skipped
+        assert set(result) == {0, 1, 3}
+        assert result[0] == b"Daft Punk"
+        assert result[3] == b"Fatboy Slim"
+        assert mock_fetch.call_count == 3
+
+    @patch("setlist_maker.artwork.fetch_artwork")
+    def test_omits_tracks_without_artwork(self, mock_fetch, sample_tracklist):
+        mock_fetch.side_effect = lambda artist, title, url, size: (
+            b"image-data" if artist == "Daft Punk" else None
+        )
+
+        result = fetch_artwork_batch(sample_tracklist.tracks)
+
+        assert result == {0: b"image-data"}
+
+    def test_returns_empty_for_no_tracks(self):
+        assert fetch_artwork_batch([]) == {}
@@ -0,0 +1,101 @@
+"""Tests for setlist_maker.cache module."""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from setlist_maker.cache import RecognitionCache
+
+
+class TestRecognitionCache:
+    """Tests for RecognitionCache."""
+
+    def test_fingerprint_depends_on_content(self):
+        """Test that identical samples share a key and different ones don't."""
+        a = np.arange(100, dtype=np.int16)
+
+        assert RecognitionCache.fingerprint(a) == RecognitionCache.fingerprint(a.copy())
+        assert RecognitionCache.fingerprint(a) != RecognitionCache.fingerprint(a[::-1])
+
+    def test_fingerprint_handles_views(self):
+        """Test that non-contiguous views hash like their contents."""
+        a = np.arange(100, dtype=np.int16)
+
+        assert RecognitionCache.fingerprint(a[::2]) == RecognitionCache.fingerprint(a[::2].copy())
+
+    def test_add_and_get(self, temp_dir):
+        """Test storing and retrieving a result."""
+        cache = RecognitionCache(temp_dir / "recognitions.json")
+        cache.add("abc", {"artist": "Daft Punk", "title": "Around the World"})
+
+        assert "abc" in cache
+        assert cache.get("abc") == {"artist": "Daft Punk", "title": "Around the World"}
+
+    def test_caches_no_match(self, temp_dir):
+        """Test that a "no match" result is distinguishable from a miss."""
+        cache = RecognitionCache(temp_dir / "recognitions.json")
+        cache.add("abc", None)
+
+        assert "abc" in cache
+        assert cache.get("abc") is None
+        assert "def" not in cache
+
+    def test_no_match_expires(self, temp_dir):
+        """Test that an old "no match" answer is treated as a miss."""
+        cache = RecognitionCache(temp_dir / "recognitions.json", no_match_ttl=timedelta(days=30))
+        cache.add("abc", None)
+        cache.entries["abc"]["cached_at"] = (datetime.now() - timedelta(days=31)).isoformat()
+
+        assert "abc" not in cache
+
+    def test_match_does_not_expire(self, temp_dir):
+        """Test that old matches are still served from the cache."""
+        cache = RecognitionCache(temp_dir / "recognitions.json", no_match_ttl=timedelta(days=30))
+        cache.add("abc", {"artist": "Daft Punk", "title": "Around the World"})
+        cache.entries["abc"]["cached_at"] = (datetime.now() - timedelta(days=365)).isoformat()
+
+        assert "abc" in cache
+
+    def test_save_and_reload(self, temp_dir):
+        """Test persistence across instances."""
+        path = temp_dir / "recognitions.json"
+        cache = RecognitionCache(path)
+        cache.add("abc", {"artist": "Fatboy Slim", "title": "Praise You"})
+        cache.save()
+
+        reloaded = RecognitionCache(path)
+
+        assert reloaded.get("abc") == {"artist": "Fatboy Slim", "title": "Praise You"}
+
+    def test_handles_corrupt_file(self, temp_dir):
+        """Test that a corrupt cache file starts an empty cache."""
+        path = temp_dir / "recognitions.json"
+        path.write_text("{not json")
+
+        cache = RecognitionCache(path)
+
+        assert cache.entries == {}
+
+    def test_saved_format(self, temp_dir):
+        """Test the on-disk layout."""
+        path = temp_dir / "recognitions.json"
+        cache = RecognitionCache(path)
+        cache.add("abc", None)
+        cache.save()
+
+        data = json.loads(path.read_text())
+        assert data["recognitions"]["abc"]["track"] is None
+
+    def test_save_skips_unchanged_cache(self, temp_dir):
+        """Test that saving without new results leaves the file alone."""
+        path = temp_dir / "recognitions.json"
+        cache = RecognitionCache(path)
+        cache.add("abc", None)
+        cache.save()
+        path.write_text('{"recognitions": {}}')
+
+        cache.save()
+
+        assert path.read_text() == '{"recognitions": {}}'
+        assert not (temp_dir / "recognitions.json.tmp").exists()
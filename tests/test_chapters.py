@@ -4,10 +4,16 @@ import io
 from pathlib import Path
 
 import pytest
+from mutagen import PaddingInfo
 from mutagen.mp3 import MP3
 from PIL import Image
 
-from setlist_maker.chapters import _remove_existing_chapters, embed_chapters
+from setlist_maker.chapters import (
+    CHAPTER_TAG_PADDING,
+    _chapter_padding,
+    _remove_existing_chapters,
+    embed_chapters,
+)
 from setlist_maker.editor import Track
 
 
@@ -260,3 +266,23 @@ class TestRemoveExistingChapters:
         audio = MP3(str(temp_mp3))
         # Should not raise
         _remove_existing_chapters(audio)
+
+
+class TestChapterPadding:
+    """Tests for _chapter_padding."""
+
+    def test_keeps_existing_padding_when_tag_fits(self):
+        assert _chapter_padding(PaddingInfo(padding=2_000_000, size=100_000_000)) == 2_000_000
+
+    def test_reserves_padding_when_tag_grows(self):
+        assert _chapter_padding(PaddingInfo(padding=-10, size=1000)) == CHAPTER_TAG_PADDING
+
+    def test_reembedding_does_not_grow_file(self, temp_mp3, sample_tracks):
+        images = {0: _make_test_jpeg(), 1: _make_test_jpeg()}
+        embed_chapters(temp_mp3, sample_tracks, chapter_images=images)
+        size_after_first = temp_mp3.stat().st_size
+
+        # Fewer images the second time: fits in the reserved padding
+        embed_chapters(temp_mp3, sample_tracks, chapter_images={0: _make_test_jpeg()})
+
+        assert temp_mp3.stat().st_size == size_after_first
@@ -1,17 +1,42 @@
 """Tests for setlist_maker.cli module."""
 
+import argparse
+import asyncio
+import io
 import json
+import wave
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
+import pytest
+
+from setlist_maker.cache import RecognitionCache
 from setlist_maker.cli import (
     AUDIO_EXTENSIONS,
+    MAX_BACKOFF,
+    RateLimiter,
     _load_tracklist_with_artwork_urls,
+    _parse_track,
+    _positive_int,
+    _retry_after_seconds,
+    append_progress,
     deduplicate_tracklist,
     format_duration,
     format_timestamp,
     get_audio_files,
+    identify_sample_with_retry,
     load_progress,
+    main,
+    process_batch,
+    process_single_file,
     results_to_tracklist,
     save_progress,
+    segment_to_wav,
+    slice_audio,
+    slice_levels_db,
+    write_atomic,
 )
 from setlist_maker.editor import CorrectionsDB
 
@@ -85,6 +110,16 @@ class TestGetAudioFiles:
         # Should find all 3 audio files, not the txt file
         assert len(files) == 3
 
+    def test_directory_sorted_and_case_insensitive(self, temp_dir):
+        """Test that directory listings are sorted by name and match any case."""
+        for name in ["b.MP3", "a.flac", "c.txt"]:
+            (temp_dir / name).write_bytes(b"")
+        (temp_dir / "sub.mp3").mkdir()
+
+        files = get_audio_files([str(temp_dir)])
+
+        assert files == [temp_dir / "a.flac", temp_dir / "b.MP3"]
+
     def test_filters_non_audio(self, temp_dir, capsys):
         """Test that non-audio files are filtered out."""
         txt_file = temp_dir / "readme.txt"
@@ -154,17 +189,74 @@ class TestSaveLoadProgress:
         assert loaded == []
 
     def test_progress_format(self, temp_dir):
-        """Test that progress is saved as valid JSON."""
+        """Test that progress is saved as one JSON document per line."""
         progress_file = temp_dir / "progress.json"
-        results = [(0, {"artist": "Test", "title": "Song"})]
+        results = [(0, {"artist": "Test", "title": "Song"}), (30, None)]
 
         save_progress(results, progress_file)
 
-        # Should be readable as JSON
-        with open(progress_file) as f:
-            data = json.load(f)
-        assert len(data) == 1
-        assert data[0][0] == 0
+        lines = progress_file.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            [0, {"artist": "Test", "title": "Song"}],
+            [30, None],
+        ]
+        assert not (temp_dir / "progress.json.tmp").exists()
+
+    def test_append_progress(self, temp_dir):
+        """Test that appended results load after the saved ones."""
+        progress_file = temp_dir / "progress.json"
+
+        save_progress([(0, None)], progress_file)
+        append_progress([(30, {"artist": "A", "title": "T"}), (60, None)], progress_file)
+
+        assert [ts for ts, _ in load_progress(progress_file)] == [0, 30, 60]
+
+    def test_load_ignores_torn_last_line(self, temp_dir):
+        """Test that a partially written last line is dropped."""
+        progress_file = temp_dir / "progress.json"
+        save_progress([(0, None), (30, None)], progress_file)
+        with open(progress_file, "a") as f:
+            f.write('[60,{"artist":"A","ti')
+
+        assert load_progress(progress_file) == [[0, None], [30, None]]
+
+    def test_load_legacy_array_format(self, temp_dir):
+        """Test that progress saved as a single indented JSON array still loads."""
+        progress_file = temp_dir / "progress.json"
+        results = [(0, {"artist": "A", "title": "T"}), (30, None)]
+        with open(progress_file, "w") as f:
+            json.dump(results, f, indent=2)
+
+        assert load_progress(progress_file) == [[0, {"artist": "A", "title": "T"}], [30, None]]
+
+    def test_load_single_result(self, temp_dir):
+        """Test that a one-line progress file isn't mistaken for the legacy format."""
+        progress_file = temp_dir / "progress.json"
+        save_progress([(0, {"artist": "A", "title": "T"})], progress_file)
+
+        assert load_progress(progress_file) == [[0, {"artist": "A", "title": "T"}]]
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic function."""
+
+    def test_replaces_existing_file(self, temp_dir):
+        """Test that the target is replaced and no temporary file remains."""
+        path = temp_dir / "set_tracklist.md"
+        path.write_text("old")
+
+        write_atomic(path, "# Tracklist — ünïcode\n")
+
+        assert path.read_text(encoding="utf-8") == "# Tracklist — ünïcode\n"
+        assert list(temp_dir.iterdir()) == [path]
+
+    def test_writes_bytes(self, temp_dir):
+        """Test that bytes are written unchanged."""
+        path = temp_dir / "set_tracklist.json"
+
+        write_atomic(path, b'[{"artist": "A"}]')
+
+        assert path.read_bytes() == b'[{"artist": "A"}]'
 
 
 class TestDeduplicateTracklist:
@@ -269,6 +361,18 @@ class TestDeduplicateTracklist:
         deduped = deduplicate_tracklist([])
         assert deduped == []
 
+    def test_case_insensitive_unicode(self):
+        """Test that matches differing only in Unicode case are merged."""
+        results = [
+            (0, {"artist": "Ätna", "title": "Straße"}),
+            (30, {"artist": "ÄTNA", "title": "STRASSE"}),
+        ]
+
+        deduped = deduplicate_tracklist(results)
+
+        assert len(deduped) == 1
+        assert deduped[0][1]["title"] == "Straße"
+
 
 class TestResultsToTracklist:
     """Tests for results_to_tracklist function."""
@@ -309,6 +413,16 @@ class TestResultsToTracklist:
         assert tracklist.tracks[0].title == "Right Title"
         assert tracklist.tracks[0].original_artist == "Wrong Artist"
 
+    def test_looks_up_each_pair_once(self):
+        """Test that repeated matches share a single correction lookup."""
+        db = MagicMock()
+        db.get_correction.return_value = None
+        results = [(ts, {"artist": "Artist", "title": "Track"}) for ts in range(0, 240, 30)]
+
+        results_to_tracklist(results, "test.mp3", corrections_db=db)
+
+        db.get_correction.assert_called_once_with("Artist", "Track")
+
     def test_handles_unidentified(self):
         """Test that unidentified tracks are preserved."""
         results = [
@@ -485,3 +599,428 @@ class TestLoadTracklistWithArtworkUrls:
 
         assert tracklist.tracks[0].coverart_url is None
         assert urls == {}
+
+
+class TestSliceAudio:
+    """Tests for slice_audio function."""
+
+    def test_slices_into_views(self):
+        """Test slicing into 30-second views with a shorter final slice."""
+        audio = np.arange(16000 * 75, dtype=np.int16)
+
+        slices = list(slice_audio(audio, 30_000))
+
+        assert [ts for ts, _ in slices] == [0, 30, 60]
+        assert [len(seg) for _, seg in slices] == [480_000, 480_000, 240_000]
+        assert all(np.shares_memory(seg, audio) for _, seg in slices)
+
+
+class TestSliceLevelsDb:
+    """Tests for slice_levels_db function."""
+
+    def test_levels_in_dbfs(self):
+        """Test RMS levels relative to 16-bit full scale."""
+        slices = [
+            (0, np.full(1000, 32767, dtype=np.int16)),
+            (30, np.full(1000, 328, dtype=np.int16)),
+            (60, np.zeros(1000, dtype=np.int16)),
+            (90, np.zeros(0, dtype=np.int16)),
+        ]
+
+        levels = slice_levels_db(slices)
+
+        assert levels[0] > -0.01
+        assert -40.1 < levels[1] < -39.9
+        assert np.isneginf(levels[2])
+        assert np.isneginf(levels[3])
+
+
+class TestSegmentToWav:
+    """Tests for segment_to_wav function."""
+
+    def test_encodes_mono_16k_wav(self):
+        """Test that samples are wrapped as 16 kHz mono 16-bit WAV."""
+        segment = np.arange(16000, dtype=np.int16)
+
+        data = segment_to_wav(segment)
+
+        with wave.open(io.BytesIO(data)) as wav:
+            assert wav.getnchannels() == 1
+            assert wav.getsampwidth() == 2
+            assert wav.getframerate() == 16000
+            frames = np.frombuffer(wav.readframes(wav.getnframes()), dtype="<i2")
+        assert np.array_equal(frames, segment)
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_out_calls(self):
+        """Test that successive waits are at least one interval apart."""
+
+        async def run():
+            limiter = RateLimiter(0.05)
+            loop = asyncio.get_running_loop()
+            starts = []
+            for _ in range(3):
+                await limiter.wait()
+                starts.append(loop.time())
+            return starts
+
+        starts = asyncio.run(run())
+        assert starts[1] - starts[0] >= 0.045
+        assert starts[2] - starts[1] >= 0.045
+
+    def test_first_call_is_immediate(self):
+        """Test that the first wait does not sleep."""
+
+        async def run():
+            limiter = RateLimiter(10)
+            loop = asyncio.get_running_loop()
+            before = loop.time()
+            await limiter.wait()
+            return loop.time() - before
+
+        assert asyncio.run(run()) < 1
+
+    def test_burst_allows_back_to_back_starts(self):
+        """Test that `burst` calls start at once before spacing applies."""
+
+        async def run():
+            limiter = RateLimiter(0.05, burst=3)
+            loop = asyncio.get_running_loop()
+            before = loop.time()
+            starts = []
+            for _ in range(4):
+                await limiter.wait()
+                starts.append(loop.time() - before)
+            return starts
+
+        starts = asyncio.run(run())
+        assert starts[2] < 0.03
+        assert starts[3] >= 0.045
+
+
+class TestProcessSingleFile:
+    """Tests for process_single_file with concurrent identification."""
+
+    def _run(self, temp_dir, identify, concurrency=3, audio=None, resume=False):
+        audio_path = temp_dir / "set.mp3"
+        audio_path.write_bytes(b"")
+        if audio is None:
+            audio = np.full(16000 * 150, 1000, dtype=np.int16)  # 5 audible slices
+
+        with (
+            patch("setlist_maker.cli.load_audio", return_value=audio),
+            patch("setlist_maker.cli.identify_sample_with_retry", side_effect=identify),
+            patch("setlist_maker.cli.Shazam"),
+        ):
+            return asyncio.run(
+                process_single_file(
+                    audio_path,
+                    output_dir=None,
+                    delay_seconds=0,
+                    resume=resume,
+                    concurrency=concurrency,
+                )
+            )
+
+    def test_results_keep_slice_order(self, temp_dir):
+        """Test that out-of-order completions still produce an ordered tracklist."""
+        calls = []
+
+        async def identify(shazam, segment, cache=None, throttle=None):
+            index = len(calls)
+            calls.append(index)
+            # Later slices finish first
+            await asyncio.sleep(0.01 * (5 - index))
+            name = "A" if index < 3 else "B"
+            return {"artist": name, "title": name}
+
+        tracklist, output_path = self._run(temp_dir, identify)
+
+        assert [t.artist for t in tracklist.tracks] == ["A", "B"]
+        assert [t.timestamp for t in tracklist.tracks] == [0, 90]
+        assert output_path.exists()
+        assert not (temp_dir / "set_progress.json").exists()
+
+    def test_bounds_requests_in_flight(self, temp_dir):
+        """Test that no more than `concurrency` identifications run at once."""
+        in_flight = 0
+        peak = 0
+
+        async def identify(shazam, segment, cache=None, throttle=None):
+            nonlocal in_flight, peak
+            async with throttle():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+            return None
+
+        self._run(temp_dir, identify, concurrency=2)
+
+        assert peak == 2
+
+    def test_saves_progress_when_interrupted(self, temp_dir):
+        """Test that finished results are checkpointed if identification fails."""
+        calls = 0
+
+        async def identify(shazam, segment, cache=None, throttle=None):
+            nonlocal calls
+            calls += 1
+            if calls == 4:
+                raise RuntimeError("connection lost")
+            return {"artist": "A", "title": "T"}
+
+        with pytest.raises(RuntimeError):
+            self._run(temp_dir, identify, concurrency=1)
+
+        progress = load_progress(temp_dir / "set_progress.json")
+        assert [ts for ts, _ in progress] == [0, 30, 60]
+
+    def test_resumes_from_progress(self, temp_dir):
+        """Test that saved results are reused and only the rest are identified."""
+        save_progress(
+            [(0, {"artist": "A", "title": "T"}), (30, None)], temp_dir / "set_progress.json"
+        )
+        identify = AsyncMock(return_value={"artist": "B", "title": "U"})
+
+        tracklist, _ = self._run(temp_dir, identify, resume=True)
+
+        assert identify.await_count == 3
+        assert [(t.timestamp, t.artist) for t in tracklist.tracks] == [(60, "B")]
+
+    def test_skips_silent_slices(self, temp_dir):
+        """Test that near-silent slices are not sent to Shazam."""
+        audio = np.full(16000 * 150, 1000, dtype=np.int16)
+        audio[: 16000 * 60] = 0  # first two slices are silent
+        identify = AsyncMock(return_value={"artist": "A", "title": "T"})
+
+        tracklist, _ = self._run(temp_dir, identify, audio=audio)
+
+        assert identify.await_count == 3
+        assert [t.timestamp for t in tracklist.tracks] == [60]
+
+
+class TestProcessBatch:
+    """Tests for process_batch."""
+
+    def test_prefetches_next_file(self, temp_dir):
+        """Test that each file is decoded once, the next one ahead of time."""
+        files = [temp_dir / "one.mp3", temp_dir / "two.mp3"]
+        for file in files:
+            file.write_bytes(b"")
+        decoded = []
+
+        def decode(path, sample_rate):
+            decoded.append(path.name)
+            return np.full(16000 * 60, 1000, dtype=np.int16)
+
+        identify = AsyncMock(return_value={"artist": "A", "title": "T"})
+
+        with (
+            patch("setlist_maker.cli.decode_audio", side_effect=decode),
+            patch("setlist_maker.cli.identify_sample_with_retry", new=identify),
+            patch("setlist_maker.cli.Shazam"),
+        ):
+            results = asyncio.run(
+                process_batch(files, None, delay_seconds=0, use_corrections=False, use_cache=False)
+            )
+
+        assert sorted(decoded) == ["one.mp3", "two.mp3"]
+        assert len(results) == 2
+        assert identify.await_count == 4
+
+
+class TestIdentifySampleWithRetry:
+    """Tests for identify_sample_with_retry function."""
+
+    SHAZAM_RESULT = {"track": {"title": "Praise You", "subtitle": "Fatboy Slim", "images": {}}}
+
+    def test_parses_track_info(self):
+        """Test that a Shazam match is converted to a track info dict."""
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(return_value=self.SHAZAM_RESULT)
+        segment = np.zeros(16000, dtype=np.int16)
+
+        info = asyncio.run(identify_sample_with_retry(shazam, segment))
+
+        assert info["artist"] == "Fatboy Slim"
+        assert info["title"] == "Praise You"
+
+    def test_uses_cache_for_repeated_audio(self, temp_dir):
+        """Test that identical samples are answered from the cache."""
+        cache = RecognitionCache(temp_dir / "recognitions.json")
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(return_value=self.SHAZAM_RESULT)
+        segment = np.ones(16000, dtype=np.int16)
+
+        first = asyncio.run(identify_sample_with_retry(shazam, segment, cache=cache))
+        second = asyncio.run(identify_sample_with_retry(shazam, segment.copy(), cache=cache))
+
+        assert first == second
+        shazam.recognize.assert_awaited_once()
+
+    def test_cache_hit_skips_throttle(self, temp_dir):
+        """Test that cached samples are answered without waiting for a request slot."""
+        cache = RecognitionCache(temp_dir / "recognitions.json")
+        segment = np.ones(16000, dtype=np.int16)
+        cache.add(cache.fingerprint(segment), {"artist": "A", "title": "T"})
+        throttle = MagicMock()
+
+        info = asyncio.run(
+            identify_sample_with_retry(MagicMock(), segment, cache=cache, throttle=throttle)
+        )
+
+        assert info == {"artist": "A", "title": "T"}
+        throttle.assert_not_called()
+
+    def test_caches_no_match(self, temp_dir):
+        """Test that a successful "no match" answer is cached."""
+        cache = RecognitionCache(temp_dir / "recognitions.json")
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(return_value={"matches": []})
+        segment = np.ones(16000, dtype=np.int16)
+
+        asyncio.run(identify_sample_with_retry(shazam, segment, cache=cache))
+        result = asyncio.run(identify_sample_with_retry(shazam, segment, cache=cache))
+
+        assert result is None
+        shazam.recognize.assert_awaited_once()
+
+    def test_does_not_cache_errors(self, temp_dir):
+        """Test that failed requests are retried on the next run."""
+        cache = RecognitionCache(temp_dir / "recognitions.json")
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(side_effect=[Exception("boom"), self.SHAZAM_RESULT])
+        segment = np.ones(16000, dtype=np.int16)
+
+        assert asyncio.run(identify_sample_with_retry(shazam, segment, cache=cache)) is None
+        info = asyncio.run(identify_sample_with_retry(shazam, segment, cache=cache))
+
+        assert info["title"] == "Praise You"
+        assert shazam.recognize.await_count == 2
+
+    def test_honors_retry_after(self):
+        """Test that a 429 with Retry-After waits exactly that long."""
+        error = Exception("429 Too Many Requests")
+        error.headers = {"Retry-After": "7"}
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(side_effect=[error, self.SHAZAM_RESULT])
+        segment = np.zeros(16000, dtype=np.int16)
+
+        with patch("setlist_maker.cli.asyncio.sleep", new=AsyncMock()) as sleep:
+            info = asyncio.run(identify_sample_with_retry(shazam, segment))
+
+        sleep.assert_awaited_once_with(7.0)
+        assert info["title"] == "Praise You"
+
+    @pytest.mark.parametrize("value", ["86400", "inf"])
+    def test_caps_retry_after(self, value):
+        """Test that a huge or infinite Retry-After is capped at MAX_BACKOFF."""
+        error = Exception("429 Too Many Requests")
+        error.headers = {"Retry-After": value}
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(side_effect=[error, self.SHAZAM_RESULT])
+        segment = np.zeros(16000, dtype=np.int16)
+
+        with patch("setlist_maker.cli.asyncio.sleep", new=AsyncMock()) as sleep:
+            asyncio.run(identify_sample_with_retry(shazam, segment))
+
+        sleep.assert_awaited_once_with(MAX_BACKOFF)
+
+    def test_backs_off_without_retry_after(self):
+        """Test that rate limits without the header use decorrelated jitter backoff."""
+        shazam = MagicMock()
+        shazam.recognize = AsyncMock(
+            side_effect=[Exception("429"), Exception("429"), self.SHAZAM_RESULT]
+        )
+        segment = np.zeros(16000, dtype=np.int16)
+
+        with patch("setlist_maker.cli.asyncio.sleep", new=AsyncMock()) as sleep:
+            asyncio.run(identify_sample_with_retry(shazam, segment))
+
+        first, second = (call.args[0] for call in sleep.await_args_list)
+        assert 30 <= first <= 90
+        assert 30 <= second <= min(300, first * 3)
+
+
+class TestParseTrack:
+    """Tests for _parse_track function."""
+
+    def test_full_match(self):
+        """Test extracting album and cover art from a complete match."""
+        track = {
+            "title": "Praise You",
+            "subtitle": "Fatboy Slim",
+            "url": "https://shazam.com/track/1",
+            "sections": [{"metadata": [{"title": "Album", "text": "You've Come a Long Way"}]}],
+            "images": {"coverart": "small.jpg", "coverarthq": "hq.jpg"},
+        }
+
+        info = _parse_track(track)
+
+        assert info["album"] == "You've Come a Long Way"
+        assert info["coverart_url"] == "hq.jpg"
+        assert info["shazam_url"] == "https://shazam.com/track/1"
+
+    def test_partial_match(self):
+        """Test that missing or empty sections and images are tolerated."""
+        for track in ({}, {"sections": []}, {"sections": [{}]}, {"sections": [{"metadata": []}]}):
+            info = _parse_track(track)
+            assert info["album"] is None
+            assert info["coverart_url"] is None
+            assert info["title"] == "Unknown Title"
+
+
+class TestRetryAfterSeconds:
+    """Tests for _retry_after_seconds function."""
+
+    def _error(self, value):
+        error = Exception("429")
+        error.headers = {"Retry-After": value}
+        return error
+
+    def test_delay_seconds(self):
+        """Test the delay-seconds form."""
+        assert _retry_after_seconds(self._error("12")) == 12.0
+
+    def test_http_date(self):
+        """Test the HTTP-date form relative to now."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        value = format_datetime(retry_at, usegmt=True)
+
+        assert 55 <= _retry_after_seconds(self._error(value)) <= 60
+
+    def test_past_date_is_zero(self):
+        """Test that a date in the past means no wait."""
+        assert _retry_after_seconds(self._error("Wed, 21 Oct 2015 07:28:00 GMT")) == 0.0
+
+    def test_missing_or_invalid(self):
+        """Test that missing or unparseable headers return None."""
+        assert _retry_after_seconds(Exception("429")) is None
+        assert _retry_after_seconds(self._error("soon")) is None
+
+
+class TestPositiveInt:
+    """Tests for the _positive_int argparse type."""
+
+    def test_accepts_positive(self):
+        """Test that values of 1 or more are returned as ints."""
+        assert _positive_int("1") == 1
+        assert _positive_int("8") == 8
+
+    @pytest.mark.parametrize("value", ["0", "-2", "two"])
+    def test_rejects_invalid(self, value):
+        """Test that zero, negative and non-numeric values are rejected."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            _positive_int(value)
+
+    def test_concurrency_zero_exits(self, capsys):
+        """Test that --concurrency 0 is rejected before any work starts."""
+        with patch("sys.argv", ["setlist-maker", "identify", "x.mp3", "--concurrency", "0"]):
+            with pytest.raises(SystemExit):
+                main()
+
+        assert "--concurrency: must be at least 1" in capsys.readouterr().err
@@ -1,9 +1,13 @@
 """Tests for setlist_maker.editor module."""
 
+import json
+from unittest.mock import patch
+
 from setlist_maker.editor import (
     CorrectionsDB,
     Track,
     Tracklist,
+    _json_bytes,
     parse_markdown_tracklist,
 )
 
@@ -147,6 +151,23 @@ class TestTracklist:
         assert data == []
 
 
+class TestJsonBytes:
+    """Tests for _json_bytes serialization."""
+
+    def test_roundtrip(self, sample_tracklist):
+        """Test that the serialized bytes parse back to the same data."""
+        data = sample_tracklist.to_json()
+        assert json.loads(_json_bytes(data)) == data
+
+    def test_fallback_without_orjson(self, sample_tracklist):
+        """Test that the stdlib serializer is used when orjson is missing."""
+        data = sample_tracklist.to_json()
+        with patch("setlist_maker.editor.orjson", None):
+            output = _json_bytes(data)
+
+        assert output == json.dumps(data, indent=2).encode()
+
+
 class TestParseMarkdownTracklist:
     """Tests for parse_markdown_tracklist function."""
 
@@ -260,6 +281,16 @@ class TestCorrectionsDB:
         result = db2.get_correction("Orig", "Title")
         assert result == ("Fixed", "Title")
 
+    def test_save_leaves_no_temp_file(self, temp_dir):
+        """Test that saving renames the temporary file into place."""
+        db_path = temp_dir / "corrections.json"
+        db = CorrectionsDB(db_path=db_path)
+        db.add_correction("Orig", "Title", "Fixed", "Title")
+        db.save()
+
+        assert json.loads(db_path.read_bytes())["corrections"]
+        assert list(temp_dir.iterdir()) == [db_path]
+
     def test_apply_corrections(self, temp_corrections_db, sample_tracklist):
         """Test applying corrections to a tracklist."""
         temp_corrections_db.add_correction(
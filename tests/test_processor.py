@@ -1,17 +1,21 @@
 """Tests for setlist_maker.processor module."""
 
+import io
 import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from setlist_maker.processor import (
     FFmpegError,
     ProcessingConfig,
+    _downsample_to_sparkline,
     build_filter_chain,
     check_ffmpeg,
     create_concat_file,
+    decode_audio,
     get_audio_duration,
     get_ffmpeg_version,
     process_audio,
@@ -440,3 +444,89 @@ class TestProcessAudio:
         result = process_audio([input_file], output_file)
 
         assert result == output_file
+
+
+class TestDecodeAudio:
+    """Tests for decode_audio function."""
+
+    def _popen(self, output=b"", errors=b"", returncode=0):
+        """Build a Popen stand-in that streams `output` and logs `errors`."""
+
+        def popen(cmd, stdout=None, stderr=None):
+            stderr.write(errors)
+            proc = MagicMock()
+            proc.stdout = io.BytesIO(output)
+            proc.returncode = returncode
+            proc.__enter__.return_value = proc
+            return proc
+
+        return popen
+
+    @patch("setlist_maker.processor.get_audio_duration", return_value=0.5)
+    @patch("subprocess.Popen")
+    def test_returns_int16_samples(self, mock_popen, mock_duration):
+        """Test raw PCM output is read into an int16 array."""
+        pcm = np.array([0, 1, -1, 32767], dtype="<i2").tobytes()
+        mock_popen.side_effect = self._popen(output=pcm)
+
+        samples = decode_audio(Path("/audio/set.mp3"), sample_rate=16000)
+
+        assert samples.dtype == np.int16
+        assert samples.tolist() == [0, 1, -1, 32767]
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+
+    @patch("setlist_maker.processor.get_audio_duration", return_value=None)
+    @patch("subprocess.Popen")
+    def test_grows_buffer_past_probed_duration(self, mock_popen, mock_duration):
+        """Test output longer than the preallocated buffer is kept in full."""
+        pcm = np.arange(-20000, 20000, dtype="<i2")
+        mock_popen.side_effect = self._popen(output=pcm.tobytes())
+
+        samples = decode_audio(Path("/audio/set.mp3"), sample_rate=8000)
+
+        assert np.array_equal(samples, pcm)
+
+    @patch("setlist_maker.processor.get_audio_duration", return_value=None)
+    @patch("subprocess.Popen")
+    def test_raises_on_failure(self, mock_popen, mock_duration):
+        """Test FFmpegError is raised when decoding fails."""
+        mock_popen.side_effect = self._popen(errors=b"bad input", returncode=1)
+
+        with pytest.raises(FFmpegError, match="bad input"):
+            decode_audio(Path("/audio/broken.mp3"))
+
+    @patch("setlist_maker.processor.get_audio_duration", return_value=None)
+    @patch("subprocess.Popen")
+    def test_raises_when_ffmpeg_missing(self, mock_popen, mock_duration):
+        """Test FFmpegError is raised when ffmpeg is not installed."""
+        mock_popen.side_effect = FileNotFoundError()
+
+        with pytest.raises(FFmpegError):
+            decode_audio(Path("/audio/set.mp3"))
+
+
+class TestDownsampleToSparkline:
+    """Tests for _downsample_to_sparkline function."""
+
+    def test_averages_buckets_and_normalizes(self):
+        """Test bucket averaging, trimming and 0-1 normalization."""
+        values = [-40.0, -40.0, -20.0, -20.0, -30.0, -30.0, -10.0]
+
+        result = _downsample_to_sparkline(values, 3)
+
+        # Buckets of 2; the trailing partial bucket is trimmed away
+        assert result == [0.0, 1.0, 0.5]
+
+    def test_flat_input(self):
+        """Test that a constant level renders as a mid-height line."""
+        assert _downsample_to_sparkline([-20.0] * 10, 4) == [0.5] * 4
+
+    def test_fewer_values_than_points(self):
+        """Test short input keeps one bucket per value."""
+        assert _downsample_to_sparkline([-30.0, -10.0], 60) == [0.0, 1.0]
+
+    def test_empty(self):
+        """Test empty input."""
+        assert _downsample_to_sparkline([], 60) == []